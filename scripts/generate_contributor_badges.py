@@ -5,190 +5,101 @@ This script creates both static and dynamic badges that contributors can use
 on their GitHub profiles, LinkedIn, personal websites, etc.
 """
 
+import argparse
+import functools
 import json
+import mmap
 import os
 import re
 import sys
+from collections import Counter, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 
-class BadgeGenerator:
-    def __init__(self):
-        # Determine script directory and project root
-        script_dir = Path(__file__).parent
-        self.project_root = script_dir.parent if script_dir.name == 'scripts' else script_dir
-        self.badges_dir = self.project_root / 'badges'
-        self.badges_dir.mkdir(exist_ok=True)
-        
-        # Achievement thresholds (based on your current system)
-        self.achievement_levels = {
-            'Beginner': {'min_challenges': 1, 'min_rate': 0, 'color': '97ca00', 'emoji': '🌱'},
-            'Advanced': {'min_challenges': 10, 'min_rate': 30, 'color': 'orange', 'emoji': '⚡'},
-            'Expert': {'min_challenges': 15, 'min_rate': 50, 'color': 'blue', 'emoji': '🎯'},
-            'Master': {'min_challenges': 20, 'min_rate': 65, 'color': 'gold', 'emoji': '🏆'}
-        }
-        
-    def get_achievement_level(self, challenges_solved: int, total_challenges: int) -> Tuple[str, str, str]:
-        """Determine achievement level based on challenges solved."""
-        completion_rate = (challenges_solved / total_challenges * 100) if total_challenges > 0 else 0
-        
-        for level in ['Master', 'Expert', 'Advanced', 'Beginner']:
-            if (challenges_solved >= self.achievement_levels[level]['min_challenges'] and 
-                completion_rate >= self.achievement_levels[level]['min_rate']):
-                return (level, 
-                       self.achievement_levels[level]['color'], 
-                       self.achievement_levels[level]['emoji'])
-        
-        return 'Beginner', self.achievement_levels['Beginner']['color'], self.achievement_levels['Beginner']['emoji']
+try:
+    import orjson
+except ImportError:  # optional speedup, the stdlib encoder produces the same bytes
+    orjson = None
 
-    def scan_classic_challenges(self) -> Dict[str, int]:
-        """Scan all classic challenge directories and count completions per user."""
-        user_completions = {}
-        total_challenges = 0
-        
-        # Find all challenge directories
-        challenge_dirs = [d for d in self.project_root.iterdir() 
-                         if d.is_dir() and d.name.startswith('challenge-')]
-        
-        total_challenges = len(challenge_dirs)
-        
-        for challenge_dir in challenge_dirs:
-            scoreboard_file = challenge_dir / 'SCOREBOARD.md'
-            if not scoreboard_file.exists():
-                continue
-                
-            try:
-                with open(scoreboard_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                # Extract user data from scoreboard
-                lines = content.split('\n')
-                for line in lines:
-                    if '|' in line and line.count('|') >= 4:
-                        parts = [p.strip() for p in line.split('|')]
-                        if len(parts) >= 4 and parts[1] and not parts[1].startswith('-'):
-                            username = parts[1].strip()
-                            try:
-                                passed_tests = int(parts[2].strip())
-                                total_tests = int(parts[3].strip())
-                                
-                                # Only count 100% completion
-                                if passed_tests == total_tests and total_tests > 0:
-                                    user_completions[username] = user_completions.get(username, 0) + 1
-                            except (ValueError, IndexError):
-                                continue
-                                
-            except Exception as e:
-                print(f"Warning: Could not process {scoreboard_file}: {e}")
-                continue
-        
-        return user_completions, total_challenges
+# A scoreboard table row: | username | passed tests | total tests |
+# The line-start anchor rejects non-table lines on their first character, and the
+# digit columns reject the header and |---| separator rows without a second pass.
+_ROW_RE = re.compile(rb'^[ \t]*\|[ \t]*(?P<user>[^|\s-][^|]*?)[ \t]*\|[ \t]*(?P<passed>\d+)[ \t]*\|[ \t]*(?P<total>\d+)[ \t]*\|',
+                     re.MULTILINE)
 
-    def scan_package_challenges(self) -> Dict[str, Dict[str, int]]:
-        """Scan package challenges and count completions per user per package."""
-        packages_dir = self.project_root / 'packages'
-        if not packages_dir.exists():
-            return {}
-            
-        user_package_completions = {}
-        
-        for package_dir in packages_dir.iterdir():
-            if not package_dir.is_dir() or package_dir.name == 'README.md':
-                continue
-                
-            package_name = package_dir.name
-            challenge_dirs = [d for d in package_dir.iterdir() 
-                            if d.is_dir() and d.name.startswith('challenge-')]
-            
-            for challenge_dir in challenge_dirs:
-                scoreboard_file = challenge_dir / 'SCOREBOARD.md'
-                if not scoreboard_file.exists():
-                    continue
-                    
-                try:
-                    with open(scoreboard_file, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    
-                    lines = content.split('\n')
-                    for line in lines:
-                        if '|' in line and line.count('|') >= 4:
-                            parts = [p.strip() for p in line.split('|')]
-                            if len(parts) >= 4 and parts[1] and not parts[1].startswith('-'):
-                                username = parts[1].strip()
-                                try:
-                                    passed_tests = int(parts[2].strip())
-                                    total_tests = int(parts[3].strip())
-                                    
-                                    if passed_tests == total_tests and total_tests > 0:
-                                        if username not in user_package_completions:
-                                            user_package_completions[username] = {}
-                                        user_package_completions[username][package_name] = \
-                                            user_package_completions[username].get(package_name, 0) + 1
-                                except (ValueError, IndexError):
-                                    continue
-                                    
-                except Exception as e:
-                    print(f"Warning: Could not process package {scoreboard_file}: {e}")
-                    continue
-        
-        return user_package_completions
+# Scoreboards smaller than this are read() rather than memory-mapped
+_MMAP_MIN_SIZE = 4096
 
-    def generate_shields_json(self, username: str, challenges_solved: int, total_challenges: int, 
-                            package_stats: Optional[Dict[str, int]] = None) -> Dict:
-        """Generate shields.io endpoint JSON for dynamic badges."""
-        level, color, emoji = self.get_achievement_level(challenges_solved, total_challenges)
-        completion_rate = round((challenges_solved / total_challenges * 100), 1) if total_challenges > 0 else 0
-        
-        # Create the main badge data
-        badge_data = {
-            "schemaVersion": 1,
-            "label": "Go Interview Practice",
-            "message": f"{emoji} {level} ({challenges_solved}/{total_challenges})",
-            "color": color,
-            "style": "for-the-badge"
-        }
-        
-        return badge_data
+# Bump when the completion rule changes, so older --cache-file entries are discarded
+_CACHE_VERSION = 1
 
-    def generate_static_badges(self) -> Dict[str, str]:
-        """Generate static badge markdown for different achievement levels."""
-        badges = {}
-        
-        # Generic contributor badge
-        badges['contributor'] = """[![Go Interview Practice Contributor](https://img.shields.io/badge/Go_Interview_Practice-Contributor-blue?style=for-the-badge&logo=go&logoColor=white)](https://github.com/RezaSi/go-interview-practice)"""
-        
-        # Achievement level badges
-        for level, config in self.achievement_levels.items():
-            emoji = config['emoji']
-            color = config['color']
-            badges[level.lower()] = f"""[![Go Interview Practice {level}](https://img.shields.io/badge/Go_Interview_Practice-{emoji}_{level}-{color}?style=for-the-badge&logo=go&logoColor=white)](https://github.com/RezaSi/go-interview-practice)"""
-        
-        return badges
+# Format stamp stored with the --cache-file cache; edits to the row pattern invalidate it automatically
+_CACHE_FORMAT = [_CACHE_VERSION, _ROW_RE.pattern.decode('ascii')]
 
-    def generate_custom_svg_badge(self, username: str, challenges_solved: int, 
-                                total_challenges: int, package_stats: Optional[Dict[str, int]] = None) -> str:
-        """Generate a beautiful custom SVG badge for the user."""
-        level, color, emoji = self.get_achievement_level(challenges_solved, total_challenges)
-        completion_rate = round((challenges_solved / total_challenges * 100), 1) if total_challenges > 0 else 0
-        
-        # Enhanced color schemes for modern look
-        color_schemes = {
-            'gold': {'primary': '#FFD700', 'secondary': '#FFA500', 'accent': '#FF8C00'},
-            'blue': {'primary': '#4A90E2', 'secondary': '#357ABD', 'accent': '#2E5F87'}, 
-            'orange': {'primary': '#FF8C42', 'secondary': '#FF6B1A', 'accent': '#E55A00'},
-            '97ca00': {'primary': '#97CA00', 'secondary': '#7BA428', 'accent': '#5F7E1F'}
-        }
-        
-        scheme = color_schemes.get(color, color_schemes['blue'])
-        
-        # Package challenge stats
-        package_count = len(package_stats) if package_stats else 0
-        total_package_challenges = sum(package_stats.values()) if package_stats else 0
+
+def _parse_scoreboard(scoreboard_file: str) -> List[str]:
+    """Parse a SCOREBOARD.md file and return the usernames that passed all tests.
+    
+    Read and decode errors propagate, so a failed parse is never cached.
+    """
+    with open(scoreboard_file, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return []
         
-        # Progress calculations
-        progress_width = int((challenges_solved / total_challenges) * 140) if total_challenges > 0 else 0
+        # Small files are cheaper to read() than to map
+        if size < _MMAP_MIN_SIZE:
+            return _completed_usernames(f.read())
         
-        svg_content = f'''<svg width="350" height="120" xmlns="http://www.w3.org/2000/svg">
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            return _completed_usernames(content)
+
+
+def _completed_usernames(content) -> List[str]:
+    """Return the usernames of rows in a scoreboard buffer that passed all tests."""
+    # findall walks the whole buffer inside the regex engine and hands back
+    # plain tuples, so no per-line strings or match objects are created.
+    # Only 100% completions count, and only their usernames get decoded.
+    return [username.decode('utf-8')
+            for username, passed_tests, total_tests in _ROW_RE.findall(content)
+            if int(passed_tests) == int(total_tests) > 0]
+
+
+def _challenge_dirs(parent_dir: str) -> List[str]:
+    """List the challenge-* subdirectories of parent_dir without a stat per entry."""
+    with os.scandir(parent_dir) as entries:
+        return [entry.path for entry in entries
+                if entry.name.startswith('challenge-') and entry.is_dir(follow_symlinks=False)]
+
+
+def _scan_workers(task_count: int) -> int:
+    """Number of threads used to read scoreboards concurrently."""
+    return max(1, min(32, task_count))
+
+
+def _dump_json(data: Dict) -> bytes:
+    """Serialize badge JSON with two-space indentation, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    # Matches orjson's output exactly, so files don't churn between environments
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _write_if_changed(path: str, content: bytes):
+    """Write content to path unless the file already holds exactly these bytes."""
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == content:
+                return
+    except FileNotFoundError:
+        pass
+    with open(path, 'wb') as f:
+        f.write(content)
+
+
+# SVG templates, filled per contributor with str.format_map
+_CARD_SVG = '''<svg width="350" height="120" xmlns="http://www.w3.org/2000/svg">
   <defs>
     <!-- Modern gradients -->
     <linearGradient id="cardGradient" x1="0%" y1="0%" x2="100%" y2="100%">
@@ -197,13 +108,13 @@ class BadgeGenerator:
     </linearGradient>
     
     <linearGradient id="headerGradient" x1="0%" y1="0%" x2="100%" y2="0%">
-      <stop offset="0%" style="stop-color:{scheme['primary']};stop-opacity:1" />
-      <stop offset="100%" style="stop-color:{scheme['secondary']};stop-opacity:1" />
+      <stop offset="0%" style="stop-color:{primary};stop-opacity:1" />
+      <stop offset="100%" style="stop-color:{secondary};stop-opacity:1" />
     </linearGradient>
     
     <linearGradient id="progressGradient" x1="0%" y1="0%" x2="100%" y2="0%">
-      <stop offset="0%" style="stop-color:{scheme['accent']};stop-opacity:1" />
-      <stop offset="100%" style="stop-color:{scheme['primary']};stop-opacity:1" />
+      <stop offset="0%" style="stop-color:{accent};stop-opacity:1" />
+      <stop offset="100%" style="stop-color:{primary};stop-opacity:1" />
     </linearGradient>
     
     <!-- Shadow filter -->
@@ -228,7 +139,7 @@ class BadgeGenerator:
   
   <!-- User info section -->
   <text x="15" y="58" font-family="SF Pro Display,-apple-system,BlinkMacSystemFont,Segoe UI,sans-serif" font-size="14" font-weight="700" fill="#212529">@{username}</text>
-  <text x="15" y="75" font-family="SF Pro Display,-apple-system,BlinkMacSystemFont,Segoe UI,sans-serif" font-size="12" font-weight="600" fill="{scheme['primary']}">{emoji} {level} Developer</text>
+  <text x="15" y="75" font-family="SF Pro Display,-apple-system,BlinkMacSystemFont,Segoe UI,sans-serif" font-size="12" font-weight="600" fill="{primary}">{emoji} {level} Developer</text>
   
   <!-- Classic Challenges Section -->
   <text x="15" y="95" font-family="SF Pro Display,-apple-system,BlinkMacSystemFont,Segoe UI,sans-serif" font-size="10" font-weight="500" fill="#6c757d">Classic Challenges</text>
@@ -242,61 +153,30 @@ class BadgeGenerator:
   <text x="160" y="106" font-family="SF Pro Display,-apple-system,BlinkMacSystemFont,Segoe UI,sans-serif" font-size="9" font-weight="600" fill="#495057">{challenges_solved}/{total_challenges} ({completion_rate}%)</text>
   
   <!-- Package Challenges Section (if any) -->'''
-        
-        if package_count > 0:
-            svg_content += f'''
+
+_CARD_SVG_PACKAGES = '''
   <text x="190" y="58" font-family="SF Pro Display,-apple-system,BlinkMacSystemFont,Segoe UI,sans-serif" font-size="10" font-weight="500" fill="#6c757d">Package Challenges</text>
-  <text x="190" y="72" font-family="SF Pro Display,-apple-system,BlinkMacSystemFont,Segoe UI,sans-serif" font-size="12" font-weight="600" fill="{scheme['secondary']}">{total_package_challenges} across {package_count} packages</text>
+  <text x="190" y="72" font-family="SF Pro Display,-apple-system,BlinkMacSystemFont,Segoe UI,sans-serif" font-size="12" font-weight="600" fill="{secondary}">{total_package_challenges} across {package_count} packages</text>
   
   <!-- Package icons -->
-  <circle cx="195" cy="82" r="3" fill="{scheme['primary']}" opacity="0.8"/>
-  <circle cx="205" cy="82" r="3" fill="{scheme['secondary']}" opacity="0.8"/>
-  <circle cx="215" cy="82" r="3" fill="{scheme['accent']}" opacity="0.8"/>'''
-        else:
-            svg_content += f'''
+  <circle cx="195" cy="82" r="3" fill="{primary}" opacity="0.8"/>
+  <circle cx="205" cy="82" r="3" fill="{secondary}" opacity="0.8"/>
+  <circle cx="215" cy="82" r="3" fill="{accent}" opacity="0.8"/>'''
+
+_CARD_SVG_NO_PACKAGES = '''
   <text x="190" y="65" font-family="SF Pro Display,-apple-system,BlinkMacSystemFont,Segoe UI,sans-serif" font-size="10" font-weight="500" fill="#6c757d">Ready for</text>
-  <text x="190" y="78" font-family="SF Pro Display,-apple-system,BlinkMacSystemFont,Segoe UI,sans-serif" font-size="12" font-weight="600" fill="{scheme['secondary']}">Package Challenges!</text>'''
-        
-        # Add achievement indicator
-        if challenges_solved >= 20:
-            svg_content += f'''
+  <text x="190" y="78" font-family="SF Pro Display,-apple-system,BlinkMacSystemFont,Segoe UI,sans-serif" font-size="12" font-weight="600" fill="{secondary}">Package Challenges!</text>'''
+
+_CARD_SVG_STAR = '''
   <!-- Achievement indicator -->
-  <circle cx="320" cy="85" r="8" fill="{scheme['primary']}" opacity="0.2"/>
-  <text x="320" y="89" font-family="SF Pro Display,-apple-system,BlinkMacSystemFont,Segoe UI,sans-serif" font-size="10" text-anchor="middle" fill="{scheme['primary']}" font-weight="700">★</text>'''
-        
-        svg_content += '''
-</svg>'''
-        
-        return svg_content
+  <circle cx="320" cy="85" r="8" fill="{primary}" opacity="0.2"/>
+  <text x="320" y="89" font-family="SF Pro Display,-apple-system,BlinkMacSystemFont,Segoe UI,sans-serif" font-size="10" text-anchor="middle" fill="{primary}" font-weight="700">★</text>'''
 
-    def generate_compact_badge(self, username: str, challenges_solved: int, 
-                             total_challenges: int, package_stats: Optional[Dict[str, int]] = None) -> str:
-        """Generate a compact horizontal badge for GitHub README."""
-        level, color, emoji = self.get_achievement_level(challenges_solved, total_challenges)
-        completion_rate = round((challenges_solved / total_challenges * 100), 1) if total_challenges > 0 else 0
-        
-        # Enhanced color schemes
-        color_schemes = {
-            'gold': {'primary': '#FFD700', 'secondary': '#FFA500'},
-            'blue': {'primary': '#4A90E2', 'secondary': '#357ABD'}, 
-            'orange': {'primary': '#FF8C42', 'secondary': '#FF6B1A'},
-            '97ca00': {'primary': '#97CA00', 'secondary': '#7BA428'}
-        }
-        
-        scheme = color_schemes.get(color, color_schemes['blue'])
-        
-        # Package info
-        package_count = len(package_stats) if package_stats else 0
-        total_package_challenges = sum(package_stats.values()) if package_stats else 0
-        
-        # Progress calculation
-        progress_width = int((challenges_solved / total_challenges) * 100) if total_challenges > 0 else 0
-        
-        svg_content = f'''<svg width="400" height="60" xmlns="http://www.w3.org/2000/svg">
+_COMPACT_SVG = '''<svg width="400" height="60" xmlns="http://www.w3.org/2000/svg">
   <defs>
     <linearGradient id="compactGradient" x1="0%" y1="0%" x2="100%" y2="0%">
-      <stop offset="0%" style="stop-color:{scheme['primary']};stop-opacity:1" />
-      <stop offset="100%" style="stop-color:{scheme['secondary']};stop-opacity:1" />
+      <stop offset="0%" style="stop-color:{primary};stop-opacity:1" />
+      <stop offset="100%" style="stop-color:{secondary};stop-opacity:1" />
     </linearGradient>
     
     <linearGradient id="compactBg" x1="0%" y1="0%" x2="0%" y2="100%">
@@ -320,7 +200,7 @@ class BadgeGenerator:
   
   <!-- Username and level -->
   <text x="20" y="38" font-family="-apple-system,BlinkMacSystemFont,Segoe UI,sans-serif" font-size="11" fill="#6c757d">@{username}</text>
-  <text x="20" y="52" font-family="-apple-system,BlinkMacSystemFont,Segoe UI,sans-serif" font-size="10" font-weight="600" fill="{scheme['primary']}">{emoji} {level} Developer</text>
+  <text x="20" y="52" font-family="-apple-system,BlinkMacSystemFont,Segoe UI,sans-serif" font-size="10" font-weight="600" fill="{primary}">{emoji} {level} Developer</text>
   
   <!-- Progress section -->
   <text x="220" y="20" font-family="-apple-system,BlinkMacSystemFont,Segoe UI,sans-serif" font-size="10" font-weight="500" fill="#495057">Classic Progress</text>
@@ -331,56 +211,319 @@ class BadgeGenerator:
   
   <!-- Stats -->
   <text x="220" y="42" font-family="-apple-system,BlinkMacSystemFont,Segoe UI,sans-serif" font-size="10" font-weight="600" fill="#495057">{challenges_solved}/{total_challenges} ({completion_rate}%)</text>'''
+
+_COMPACT_SVG_PACKAGES = '''
+  <text x="220" y="54" font-family="-apple-system,BlinkMacSystemFont,Segoe UI,sans-serif" font-size="9" fill="{secondary}">📦 {total_package_challenges} package challenges</text>'''
+
+_COMPACT_SVG_ACHIEVEMENT = '''
+  <circle cx="365" cy="30" r="12" fill="{primary}" opacity="0.1"/>
+  <text x="365" y="34" font-family="-apple-system,BlinkMacSystemFont,Segoe UI,sans-serif" font-size="12" text-anchor="middle" fill="{primary}">{tier_icon}</text>'''
+
+_SVG_END = '''
+</svg>'''
+
+# Full card layout per (has_packages, has_star)
+_CARD_SVG_VARIANTS = {
+    (has_packages, has_star): (_CARD_SVG
+                               + (_CARD_SVG_PACKAGES if has_packages else _CARD_SVG_NO_PACKAGES)
+                               + (_CARD_SVG_STAR if has_star else '')
+                               + _SVG_END)
+    for has_packages in (False, True)
+    for has_star in (False, True)
+}
+
+# Compact layout per has_packages
+_COMPACT_SVG_VARIANTS = {
+    has_packages: (_COMPACT_SVG
+                   + (_COMPACT_SVG_PACKAGES if has_packages else '')
+                   + _COMPACT_SVG_ACHIEVEMENT
+                   + _SVG_END)
+    for has_packages in (False, True)
+}
+
+# Enhanced color schemes for modern look, keyed by achievement color
+_COLOR_SCHEMES = {
+    'gold': {'primary': '#FFD700', 'secondary': '#FFA500', 'accent': '#FF8C00'},
+    'blue': {'primary': '#4A90E2', 'secondary': '#357ABD', 'accent': '#2E5F87'},
+    'orange': {'primary': '#FF8C42', 'secondary': '#FF6B1A', 'accent': '#E55A00'},
+    '97ca00': {'primary': '#97CA00', 'secondary': '#7BA428', 'accent': '#5F7E1F'}
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _scheme_template(template: str, color: str) -> str:
+    """Bake a color scheme into an SVG template, leaving only the per-user fields."""
+    scheme = _COLOR_SCHEMES.get(color, _COLOR_SCHEMES['blue'])
+    for name, value in scheme.items():
+        template = template.replace('{%s}' % name, value)
+    return template
+
+
+# Per-contributor values shared by all badge renderers
+BadgeContext = namedtuple('BadgeContext', 'username solved total rate level color emoji package_count package_total')
+
+
+class BadgeGenerator:
+    # Achievement levels from highest to lowest
+    _LEVEL_ORDER = ('Master', 'Expert', 'Advanced', 'Beginner')
+    
+    def __init__(self, cache_file: Optional[Path] = None, with_readme: bool = False):
+        # Determine script directory and project root
+        script_dir = Path(__file__).parent
+        self.project_root = script_dir.parent if script_dir.name == 'scripts' else script_dir
+        self.badges_dir = self.project_root / 'badges'
+        self.badges_dir.mkdir(exist_ok=True)
         
-        if package_count > 0:
-            svg_content += f'''
-  <text x="220" y="54" font-family="-apple-system,BlinkMacSystemFont,Segoe UI,sans-serif" font-size="9" fill="{scheme['secondary']}">📦 {total_package_challenges} package challenges</text>'''
+        # Achievement thresholds (based on your current system)
+        self.achievement_levels = {
+            'Beginner': {'min_challenges': 1, 'min_rate': 0, 'color': '97ca00', 'emoji': '🌱'},
+            'Advanced': {'min_challenges': 10, 'min_rate': 30, 'color': 'orange', 'emoji': '⚡'},
+            'Expert': {'min_challenges': 15, 'min_rate': 50, 'color': 'blue', 'emoji': '🎯'},
+            'Master': {'min_challenges': 20, 'min_rate': 65, 'color': 'gold', 'emoji': '🏆'}
+        }
         
-        # Achievement badge
-        if challenges_solved >= 20:
-            svg_content += f'''
-  <circle cx="365" cy="30" r="12" fill="{scheme['primary']}" opacity="0.1"/>
-  <text x="365" y="34" font-family="-apple-system,BlinkMacSystemFont,Segoe UI,sans-serif" font-size="12" text-anchor="middle" fill="{scheme['primary']}">⭐</text>'''
-        elif challenges_solved >= 15:
-            svg_content += f'''
-  <circle cx="365" cy="30" r="12" fill="{scheme['primary']}" opacity="0.1"/>
-  <text x="365" y="34" font-family="-apple-system,BlinkMacSystemFont,Segoe UI,sans-serif" font-size="12" text-anchor="middle" fill="{scheme['primary']}">🎯</text>'''
-        elif challenges_solved >= 10:
-            svg_content += f'''
-  <circle cx="365" cy="30" r="12" fill="{scheme['primary']}" opacity="0.1"/>
-  <text x="365" y="34" font-family="-apple-system,BlinkMacSystemFont,Segoe UI,sans-serif" font-size="12" text-anchor="middle" fill="{scheme['primary']}">⚡</text>'''
-        else:
-            svg_content += f'''
-  <circle cx="365" cy="30" r="12" fill="{scheme['primary']}" opacity="0.1"/>
-  <text x="365" y="34" font-family="-apple-system,BlinkMacSystemFont,Segoe UI,sans-serif" font-size="12" text-anchor="middle" fill="{scheme['primary']}">🌱</text>'''
+        # Per-user USERNAME_badges.md collections are only written on request
+        self.with_readme = with_readme
         
-        svg_content += '''
-</svg>'''
+        # Parsed scoreboard rows keyed by path, reused while the file's (mtime, size) is unchanged
+        self.cache_file = cache_file
+        self.scoreboard_cache = self.load_scoreboard_cache()
+        
+        # (level, color, emoji) lookup tables indexed by challenges solved, keyed by total challenges
+        self.level_tables: Dict[int, List[Tuple[str, str, str]]] = {}
+        
+    def load_scoreboard_cache(self) -> Dict[str, list]:
+        """Load the parsed scoreboard cache from a previous run, if one was requested.
+        
+        A cache written with a different _CACHE_FORMAT is discarded.
+        """
+        if not self.cache_file:
+            return {}
         
-        return svg_content
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        
+        if not isinstance(data, dict) or data.get('format') != _CACHE_FORMAT:
+            return {}
+        entries = data.get('entries')
+        return entries if isinstance(entries, dict) else {}
+
+    def save_scoreboard_cache(self):
+        """Persist the parsed scoreboard cache for the next run."""
+        if not self.cache_file:
+            return
+        
+        tmp_file = self.cache_file.with_name(self.cache_file.name + '.tmp')
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump({'format': _CACHE_FORMAT, 'entries': self.scoreboard_cache}, f)
+            os.replace(tmp_file, self.cache_file)
+        except OSError as e:
+            print(f"Could not save scoreboard cache: {e}", file=sys.stderr)
+
+    def read_scoreboard(self, scoreboard_file: str) -> List[str]:
+        """Return a scoreboard's completed usernames, skipping the parse when the file is unchanged."""
+        try:
+            stat = os.stat(scoreboard_file)
+        except FileNotFoundError:
+            return []
+        
+        stamp = [stat.st_mtime_ns, stat.st_size]
+        cached = self.scoreboard_cache.get(scoreboard_file)
+        if cached and cached[:2] == stamp:
+            return cached[2]
+        
+        try:
+            usernames = _parse_scoreboard(scoreboard_file)
+        except Exception as e:
+            # Not cached, so the next run tries this scoreboard again
+            print(f"Warning: Could not process {scoreboard_file}: {e}")
+            return []
+        
+        self.scoreboard_cache[scoreboard_file] = stamp + [usernames]
+        return usernames
 
-    def generate_readme_badges(self, username: str, challenges_solved: int, 
-                             total_challenges: int, package_stats: Optional[Dict[str, int]] = None) -> str:
-        """Generate a comprehensive badge collection for README files."""
+    def get_achievement_level(self, challenges_solved: int, total_challenges: int) -> Tuple[str, str, str]:
+        """Determine achievement level based on challenges solved."""
+        # Levels for every possible solved count are tabulated once per total
+        table = self.level_tables.get(total_challenges)
+        if table is None:
+            table = [self.classify_achievement(solved, total_challenges)
+                     for solved in range(total_challenges + 1)]
+            self.level_tables[total_challenges] = table
+        
+        if 0 <= challenges_solved < len(table):
+            return table[challenges_solved]
+        return self.classify_achievement(challenges_solved, total_challenges)
+
+    def classify_achievement(self, challenges_solved: int, total_challenges: int) -> Tuple[str, str, str]:
+        """Walk the achievement thresholds from the highest level down."""
+        completion_rate = (challenges_solved / total_challenges * 100) if total_challenges > 0 else 0
+        
+        for level in self._LEVEL_ORDER:
+            if (challenges_solved >= self.achievement_levels[level]['min_challenges'] and 
+                completion_rate >= self.achievement_levels[level]['min_rate']):
+                return (level, 
+                       self.achievement_levels[level]['color'], 
+                       self.achievement_levels[level]['emoji'])
+        
+        return 'Beginner', self.achievement_levels['Beginner']['color'], self.achievement_levels['Beginner']['emoji']
+
+    def scan_classic_challenges(self) -> Tuple[Dict[str, int], int]:
+        """Scan all classic challenge directories and count completions per user."""
+        user_completions = Counter()
+        
+        # Find all challenge directories
+        challenge_dirs = _challenge_dirs(self.project_root)
+        
+        total_challenges = len(challenge_dirs)
+        scoreboard_files = [os.path.join(d, 'SCOREBOARD.md') for d in challenge_dirs]
+        
+        # Scoreboards are independent, so read and parse them concurrently
+        with ThreadPoolExecutor(max_workers=_scan_workers(len(scoreboard_files))) as executor:
+            for usernames in executor.map(self.read_scoreboard, scoreboard_files):
+                user_completions.update(usernames)
+        
+        return dict(user_completions), total_challenges
+
+    def scan_package_challenges(self) -> Dict[str, Dict[str, int]]:
+        """Scan package challenges and count completions per user per package."""
+        packages_dir = self.project_root / 'packages'
+        if not packages_dir.exists():
+            return {}
+            
+        user_package_completions = {}
+        tasks = []
+        
+        with os.scandir(packages_dir) as package_entries:
+            package_dirs = [entry for entry in package_entries if entry.is_dir(follow_symlinks=False)]
+        
+        for package_dir in package_dirs:
+            tasks.extend((package_dir.name, os.path.join(d, 'SCOREBOARD.md'))
+                         for d in _challenge_dirs(package_dir.path))
+        
+        with ThreadPoolExecutor(max_workers=_scan_workers(len(tasks))) as executor:
+            results = executor.map(self.read_scoreboard, [scoreboard_file for _, scoreboard_file in tasks])
+            
+            # Fold the per-file results into the per-user totals on the main thread
+            for (package_name, _), usernames in zip(tasks, results):
+                for username in usernames:
+                    package_stats = user_package_completions.setdefault(username, {})
+                    package_stats[package_name] = package_stats.get(package_name, 0) + 1
+        
+        return user_package_completions
+
+    def build_context(self, username: str, challenges_solved: int, total_challenges: int,
+                      package_stats: Optional[Dict[str, int]] = None) -> BadgeContext:
+        """Collect everything the badge renderers need to know about one contributor."""
         level, color, emoji = self.get_achievement_level(challenges_solved, total_challenges)
         completion_rate = round((challenges_solved / total_challenges * 100), 1) if total_challenges > 0 else 0
         
+        return BadgeContext(
+            username=username,
+            solved=challenges_solved,
+            total=total_challenges,
+            rate=completion_rate,
+            level=level,
+            color=color,
+            emoji=emoji,
+            package_count=len(package_stats) if package_stats else 0,
+            package_total=sum(package_stats.values()) if package_stats else 0,
+        )
+
+    def generate_shields_json(self, ctx: BadgeContext) -> Dict:
+        """Generate shields.io endpoint JSON for dynamic badges."""
+        # Create the main badge data
+        badge_data = {
+            "schemaVersion": 1,
+            "label": "Go Interview Practice",
+            "message": f"{ctx.emoji} {ctx.level} ({ctx.solved}/{ctx.total})",
+            "color": ctx.color,
+            "style": "for-the-badge"
+        }
+        
+        return badge_data
+
+    def generate_static_badges(self) -> Dict[str, str]:
+        """Generate static badge markdown for different achievement levels."""
+        badges = {}
+        
+        # Generic contributor badge
+        badges['contributor'] = """[![Go Interview Practice Contributor](https://img.shields.io/badge/Go_Interview_Practice-Contributor-blue?style=for-the-badge&logo=go&logoColor=white)](https://github.com/RezaSi/go-interview-practice)"""
+        
+        # Achievement level badges
+        for level, config in self.achievement_levels.items():
+            emoji = config['emoji']
+            color = config['color']
+            badges[level.lower()] = f"""[![Go Interview Practice {level}](https://img.shields.io/badge/Go_Interview_Practice-{emoji}_{level}-{color}?style=for-the-badge&logo=go&logoColor=white)](https://github.com/RezaSi/go-interview-practice)"""
+        
+        return badges
+
+    def generate_custom_svg_badge(self, ctx: BadgeContext) -> str:
+        """Generate a beautiful custom SVG badge for the user."""
+        # Progress calculations
+        progress_width = int((ctx.solved / ctx.total) * 140) if ctx.total > 0 else 0
+        
+        template = _scheme_template(_CARD_SVG_VARIANTS[(ctx.package_count > 0, ctx.solved >= 20)], ctx.color)
+        return template.format_map({
+            'username': ctx.username,
+            'level': ctx.level,
+            'emoji': ctx.emoji,
+            'progress_width': progress_width,
+            'challenges_solved': ctx.solved,
+            'total_challenges': ctx.total,
+            'completion_rate': ctx.rate,
+            'package_count': ctx.package_count,
+            'total_package_challenges': ctx.package_total,
+        })
+
+    def generate_compact_badge(self, ctx: BadgeContext) -> str:
+        """Generate a compact horizontal badge for GitHub README."""
+        # Progress calculation
+        progress_width = int((ctx.solved / ctx.total) * 100) if ctx.total > 0 else 0
+        
+        # Achievement badge
+        if ctx.solved >= 20:
+            tier_icon = '⭐'
+        elif ctx.solved >= 15:
+            tier_icon = '🎯'
+        elif ctx.solved >= 10:
+            tier_icon = '⚡'
+        else:
+            tier_icon = '🌱'
+        
+        template = _scheme_template(_COMPACT_SVG_VARIANTS[ctx.package_count > 0], ctx.color)
+        return template.format_map({
+            'username': ctx.username,
+            'level': ctx.level,
+            'emoji': ctx.emoji,
+            'progress_width': progress_width,
+            'challenges_solved': ctx.solved,
+            'total_challenges': ctx.total,
+            'completion_rate': ctx.rate,
+            'total_package_challenges': ctx.package_total,
+            'tier_icon': tier_icon,
+        })
+
+    def generate_readme_badges(self, ctx: BadgeContext) -> str:
+        """Generate a comprehensive badge collection for README files."""
         # Dynamic badge (requires the JSON endpoint) - with clickable link
-        dynamic_badge = f"""[![Go Interview Practice](https://img.shields.io/endpoint?url=https://raw.githubusercontent.com/RezaSi/go-interview-practice/main/badges/{username}.json&style=for-the-badge&logo=go&logoColor=white)](https://github.com/RezaSi/go-interview-practice)"""
+        dynamic_badge = f"""[![Go Interview Practice](https://img.shields.io/endpoint?url=https://raw.githubusercontent.com/RezaSi/go-interview-practice/main/badges/{ctx.username}.json&style=for-the-badge&logo=go&logoColor=white)](https://github.com/RezaSi/go-interview-practice)"""
         
         # Static badges - with clickable links
-        challenge_badge = f"""[![Challenges Solved](https://img.shields.io/badge/Go_Challenges-{challenges_solved}%2F{total_challenges}-brightgreen?style=for-the-badge&logo=go&logoColor=white)](https://github.com/RezaSi/go-interview-practice)"""
+        challenge_badge = f"""[![Challenges Solved](https://img.shields.io/badge/Go_Challenges-{ctx.solved}%2F{ctx.total}-brightgreen?style=for-the-badge&logo=go&logoColor=white)](https://github.com/RezaSi/go-interview-practice)"""
         
-        level_badge = f"""[![Achievement Level](https://img.shields.io/badge/Level-{emoji}_{level}-{color}?style=for-the-badge&logo=trophy&logoColor=white)](https://github.com/RezaSi/go-interview-practice)"""
+        level_badge = f"""[![Achievement Level](https://img.shields.io/badge/Level-{ctx.emoji}_{ctx.level}-{ctx.color}?style=for-the-badge&logo=trophy&logoColor=white)](https://github.com/RezaSi/go-interview-practice)"""
         
-        completion_badge = f"""[![Completion Rate](https://img.shields.io/badge/Completion-{completion_rate}%25-{color}?style=for-the-badge&logo=checkmarx&logoColor=white)](https://github.com/RezaSi/go-interview-practice)"""
+        completion_badge = f"""[![Completion Rate](https://img.shields.io/badge/Completion-{ctx.rate}%25-{ctx.color}?style=for-the-badge&logo=checkmarx&logoColor=white)](https://github.com/RezaSi/go-interview-practice)"""
         
         # Package badges if available - with clickable link
         package_badges = ""
-        if package_stats:
-            total_package_challenges = sum(package_stats.values())
-            package_count = len(package_stats)
-            package_badges = f"""[![Package Challenges](https://img.shields.io/badge/Package_Challenges-{total_package_challenges}_across_{package_count}_packages-purple?style=for-the-badge&logo=package&logoColor=white)](https://github.com/RezaSi/go-interview-practice)"""
+        if ctx.package_count:
+            package_badges = f"""[![Package Challenges](https://img.shields.io/badge/Package_Challenges-{ctx.package_total}_across_{ctx.package_count}_packages-purple?style=for-the-badge&logo=package&logoColor=white)](https://github.com/RezaSi/go-interview-practice)"""
         
         badges_collection = f"""## 🏆 Go Interview Practice Achievements
 
@@ -388,10 +531,10 @@ class BadgeGenerator:
 *Click any badge to visit the Go Interview Practice repository!*
 
 <!-- Full-size Card Badge - Clickable -->
-[![Go Interview Practice Achievement Card](https://raw.githubusercontent.com/RezaSi/go-interview-practice/main/badges/{username}.svg)](https://github.com/RezaSi/go-interview-practice)
+[![Go Interview Practice Achievement Card](https://raw.githubusercontent.com/RezaSi/go-interview-practice/main/badges/{ctx.username}.svg)](https://github.com/RezaSi/go-interview-practice)
 
 <!-- Compact Horizontal Badge - Clickable -->
-[![Go Interview Practice Compact](https://raw.githubusercontent.com/RezaSi/go-interview-practice/main/badges/{username}_compact.svg)](https://github.com/RezaSi/go-interview-practice)
+[![Go Interview Practice Compact](https://raw.githubusercontent.com/RezaSi/go-interview-practice/main/badges/{ctx.username}_compact.svg)](https://github.com/RezaSi/go-interview-practice)
 
 ### 🔄 Dynamic Shields.io Badge
 <!-- Dynamic Badge (auto-updates) -->
@@ -410,17 +553,23 @@ class BadgeGenerator:
 
 ### 📈 Your Achievement Summary
 
-**👤 Username:** @{username}  
-**🏅 Achievement Level:** {emoji} **{level} Developer**  
-**📊 Classic Challenges:** {challenges_solved}/{total_challenges} ({completion_rate}% complete)  
+**👤 Username:** @{ctx.username}  
+**🏅 Achievement Level:** {ctx.emoji} **{ctx.level} Developer**  
+**📊 Classic Challenges:** {ctx.solved}/{ctx.total} ({ctx.rate}% complete)  
 **🔗 Repository:** [Go Interview Practice](https://github.com/RezaSi/go-interview-practice)  
 """
         
-        if package_stats:
-            badges_collection += f"**Package Challenges:** {sum(package_stats.values())} across {len(package_stats)} packages\n"
+        if ctx.package_count:
+            badges_collection += f"**Package Challenges:** {ctx.package_total} across {ctx.package_count} packages\n"
         
         return badges_collection
 
+    def write_outputs(self, outputs: List[Tuple[str, bytes]]):
+        """Write all rendered badge files using a small pool of writer threads."""
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            # list() surfaces any write error raised in a worker
+            list(executor.map(lambda output: _write_if_changed(*output), outputs))
+
     def run(self):
         """Main execution function."""
         print("🎯 Generating contributor badges...")
@@ -431,66 +580,61 @@ class BadgeGenerator:
         
         print("📦 Scanning package challenges...")
         package_completions = self.scan_package_challenges()
+        self.save_scoreboard_cache()
         
         # Generate badges for each contributor
         generated_count = 0
         
+        # Rendered files are collected first and written in one batch at the end
+        outputs: List[Tuple[str, bytes]] = []
+        badges_dir = os.fspath(self.badges_dir)
+        
         # Combine all contributors
-        all_contributors = set(classic_completions.keys()) | set(package_completions.keys())
+        all_contributors = classic_completions.keys() | package_completions.keys()
         
         for username in all_contributors:
             classic_solved = classic_completions.get(username, 0)
             package_stats = package_completions.get(username, {})
             
-            # Generate dynamic badge JSON
-            badge_json = self.generate_shields_json(username, classic_solved, total_classic, package_stats)
-            json_file = self.badges_dir / f"{username}.json"
+            # Derive level, rate and package totals once and share them with every renderer
+            ctx = self.build_context(username, classic_solved, total_classic, package_stats)
             
-            with open(json_file, 'w', encoding='utf-8') as f:
-                json.dump(badge_json, f, indent=2)
+            # Generate dynamic badge JSON
+            badge_json = self.generate_shields_json(ctx)
+            outputs.append((os.path.join(badges_dir, f"{username}.json"), _dump_json(badge_json)))
             
             # Generate custom SVG (full card)
-            svg_content = self.generate_custom_svg_badge(username, classic_solved, total_classic, package_stats)
-            svg_file = self.badges_dir / f"{username}.svg"
-            
-            with open(svg_file, 'w', encoding='utf-8') as f:
-                f.write(svg_content)
+            svg_content = self.generate_custom_svg_badge(ctx)
+            outputs.append((os.path.join(badges_dir, f"{username}.svg"), svg_content.encode('utf-8')))
             
             # Generate compact badge
-            compact_svg_content = self.generate_compact_badge(username, classic_solved, total_classic, package_stats)
-            compact_svg_file = self.badges_dir / f"{username}_compact.svg"
+            compact_svg_content = self.generate_compact_badge(ctx)
+            outputs.append((os.path.join(badges_dir, f"{username}_compact.svg"), compact_svg_content.encode('utf-8')))
             
-            with open(compact_svg_file, 'w', encoding='utf-8') as f:
-                f.write(compact_svg_content)
-            
-            # Generate README badges collection (optional - comment out to reduce files)
-            readme_content = self.generate_readme_badges(username, classic_solved, total_classic, package_stats)
-            readme_file = self.badges_dir / f"{username}_badges.md"
-            
-            with open(readme_file, 'w', encoding='utf-8') as f:
-                f.write(readme_content)
+            # Generate README badges collection (optional - enabled with --with-readme)
+            if self.with_readme:
+                readme_content = self.generate_readme_badges(ctx)
+                outputs.append((os.path.join(badges_dir, f"{username}_badges.md"), readme_content.encode('utf-8')))
             
             generated_count += 1
             print(f"  ✅ Generated badges for {username} ({classic_solved} challenges)")
         
         # Generate static badge templates
         static_badges = self.generate_static_badges()
-        static_file = self.badges_dir / "static_badges.md"
-        
-        with open(static_file, 'w', encoding='utf-8') as f:
-            f.write("# Static Badge Templates\n\n")
-            f.write("These badges can be used by any contributor:\n\n")
-            for badge_name, badge_code in static_badges.items():
-                f.write(f"## {badge_name.title()}\n")
-                f.write(f"```markdown\n{badge_code}\n```\n")
-                f.write(f"{badge_code}\n\n")
+        static_lines = ["# Static Badge Templates\n\n",
+                        "These badges can be used by any contributor:\n\n"]
+        for badge_name, badge_code in static_badges.items():
+            static_lines.append(f"## {badge_name.title()}\n")
+            static_lines.append(f"```markdown\n{badge_code}\n```\n")
+            static_lines.append(f"{badge_code}\n\n")
+        outputs.append((os.path.join(badges_dir, "static_badges.md"), ''.join(static_lines).encode('utf-8')))
         
         # Generate instructions
         instructions = self.generate_instructions()
-        instructions_file = self.badges_dir / "README.md"
+        instructions_file = os.path.join(badges_dir, "README.md")
+        outputs.append((instructions_file, instructions.encode('utf-8')))
         
-        with open(instructions_file, 'w', encoding='utf-8') as f:
-            f.write(instructions)
+        self.write_outputs(outputs)
         
         print(f"\n🎉 Successfully generated badges for {generated_count} contributors!")
         print(f"📁 Badge files saved to: {self.badges_dir}")
@@ -681,6 +825,19 @@ Check out badges from our top contributors:
 *Beautiful badges that showcase your coding excellence and motivate continuous learning.*
 """
 
+def main(argv=None):
+    """Parse command line arguments and generate the badges."""
+    parser = argparse.ArgumentParser(description="Generate contributor profile badges.")
+    parser.add_argument('--cache-file', type=Path,
+                        help="reuse parsed scoreboards from this file across runs")
+    parser.add_argument('--with-readme', action='store_true',
+                        help="also write the per-user USERNAME_badges.md collections")
+    args = parser.parse_args(argv)
+    
+    generator = BadgeGenerator(cache_file=args.cache_file, with_readme=args.with_readme)
+    generator.run()
+    return 0
+
+
 if __name__ == "__main__":
-    generator = BadgeGenerator()
-    generator.run()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
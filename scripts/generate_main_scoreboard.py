@@ -3,69 +3,156 @@
 Script to generate the main scoreboard for README.md by aggregating data from all challenge scoreboards.
 """
 
+import argparse
+import json
+import logging
 import os
 import re
 import sys
+import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bisect import bisect_right
 from collections import defaultdict
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
+from scoreboard_common import (ROOT, buffered_log, cached_result, completed_users, load_cache,
+                               log_rows, rank_label, save_cache, scan_scoreboard)
 
-def parse_scoreboard_file(filepath):
-    """Parse a SCOREBOARD.md file and extract usernames who completed the challenge (passed ALL tests)."""
-    users = set()
+
+logger = logging.getLogger(__name__)
+
+# Sidecar file caching parsed scoreboards between runs, keyed by file path
+CACHE_FILE = os.path.join(ROOT, '.scoreboard_cache.json')
+
+# Shared HTTP session: keeps connections alive and retries transient gateway errors
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(max_retries=Retry(total=3, backoff_factor=0.3,
+                                                         status_forcelist=[502, 503, 504])))
+
+# Sponsor avatars on the GitHub sponsors page, matched against the raw response bytes
+_AVATAR_RE = re.compile(rb'alt="@([a-zA-Z0-9][a-zA-Z0-9\-]*)"')
+
+# Sponsors scraped from GitHub are reused from this file for SPONSORS_CACHE_TTL seconds
+SPONSORS_CACHE_FILE = os.path.join(ROOT, '.cache', 'sponsors.json')
+SPONSORS_CACHE_TTL = 15 * 60
+
+# Name prefix of challenge directories, followed by the challenge number
+_CHALLENGE_DIR_PREFIX = 'challenge-'
+
+# Sections that can follow the classic leaderboard when its end marker is missing
+_NEXT_SECTION_RE = re.compile('## 🚀 Package Challenges Leaderboard|## Key Features|## Getting Started')
+
+# Header rows of the leaderboard markdown table
+_LEADERBOARD_HEADER = (
+    '| 🏅 | Developer | Solved | Rate | Achievement | Progress |',
+    '|:---:|:---:|:---:|:---:|:---:|:---|'
+)
+
+# Heading and blurb that open the classic leaderboard section
+_LEADERBOARD_INTRO = (
+    "## 🏆 Top 10 Leaderboard",
+    "",
+    "Our most accomplished Go developers, ranked by number of challenges completed:",
+    "",
+    "> **Note**: The data below is automatically updated by GitHub Actions when challenge scoreboards change.",
+    "",
+)
+
+# Centered legend below the table, filled with the total number of challenges
+_LEADERBOARD_LEGEND = '\n'.join([
+    '',
+    '<div align="center">',
+    '',
+    '✅ Completed • ⬜ Not Completed',
+    '',
+    '*All %d challenges shown in two rows*',
+    '',
+    '</div>'
+])
+
+# One leaderboard table row, filled with %-formatting
+_LEADERBOARD_ROW = (
+    '| %(rank)s '
+    '| <img src="https://github.com/%(username)s.png" width="24" height="24" style="border-radius: 50%%;">'
+    '<br/>**[%(username)s](https://github.com/%(username)s)**%(sponsor)s '
+    '| **%(count)d**/%(total)d '
+    '| **%(rate).1f%%** '
+    '| %(achievement)s '
+    '| %(indicators)s |'
+)
+
+# Achievement tiers: completing _ACHIEVEMENT_THRESHOLDS[k] challenges earns _ACHIEVEMENT_NAMES[k + 1]
+_ACHIEVEMENT_THRESHOLDS = (5, 10, 15, 20)
+_ACHIEVEMENT_NAMES = ("Beginner", "Intermediate", "Advanced", "Expert", "Master")
+
+# Size of the shortest possible scoreboard row, "|x|0|0"
+_MIN_ROW_SIZE = 6
+
+
+
+def parse_scoreboard_file(filepath, cache=None):
+    """Parse a SCOREBOARD.md file and extract usernames who completed the challenge (passed ALL tests).
+    
+    When a cache dict is given, scoreboards whose mtime and size match the
+    cached entry are not parsed again; only their summary is logged, not their rows.
+    """
+    parsed = _read_scoreboard(filepath, cache)
+    if parsed is None:
+        return set()
+    
+    _log_scoreboard(filepath, *parsed)
+    return set(parsed[0])
+
+
+def _read_scoreboard(filepath, cache=None):
+    """Return (completed usernames, incomplete row count, rows) for a scoreboard, or None if unreadable.
     
+    rows holds every user row as (username, passed, total), in order. It is None
+    for results served from the cache, which keeps only the usernames and count.
+    """
     try:
-        with open(filepath, 'r') as f:
-            content = f.read()
-        
-        # Split into lines and process
-        lines = content.strip().split('\n')
+        if cache is None:
+            rows = scan_scoreboard(filepath)
+            completed = completed_users(rows)
+            return completed, len(rows) - len(completed), rows
         
-        for line in lines:
-            # Skip header and separator lines
-            if not line.strip() or 'Username' in line or '---' in line or line.startswith('#'):
-                continue
-            
-            # Parse table row
-            if '|' in line:
-                parts = [part.strip() for part in line.split('|')]
-                if len(parts) >= 4:  # Username | Passed Tests | Total Tests | (optional extra columns)
-                    username = parts[1]
-                    passed_tests_str = parts[2]
-                    total_tests_str = parts[3]
-                    
-                    # Skip empty usernames or placeholders
-                    if not username or username == '------' or username.isdigit():
-                        continue
-                    
-                    try:
-                        # Extract numbers from test counts (handles formats like "6", "6 tests", etc.)
-                        passed_tests = int(''.join(filter(str.isdigit, passed_tests_str)))
-                        total_tests = int(''.join(filter(str.isdigit, total_tests_str)))
-                        
-                        # Only count as completed if ALL tests passed
-                        if passed_tests > 0 and passed_tests == total_tests:
-                            users.add(username)
-                            print(f"  ✅ {username}: {passed_tests}/{total_tests} tests passed (COMPLETED)")
-                        else:
-                            print(f"  ❌ {username}: {passed_tests}/{total_tests} tests passed (incomplete)")
-                            
-                    except (ValueError, TypeError):
-                        # If we can't parse test numbers, skip this entry
-                        print(f"  ⚠️  {username}: Could not parse test results")
-                        continue
+        completed, incomplete = cached_result(cache, filepath, _summarize_scoreboard)
+        return completed, incomplete, None
     
     except FileNotFoundError:
         pass
     except Exception as e:
         print(f"Error parsing {filepath}: {e}", file=sys.stderr)
     
-    return users
+    return None
+
+
+def _summarize_scoreboard(filepath):
+    """Read a scoreboard into the cached [completed usernames, incomplete row count] pair."""
+    rows = scan_scoreboard(filepath)
+    completed = completed_users(rows)
+    return [completed, len(rows) - len(completed)]
+
+
+def _log_scoreboard(filepath, completed, incomplete, rows):
+    """Log a scoreboard's rows (when parsed rather than cached) and its per-file summary."""
+    if rows is not None:
+        log_rows(logger, rows)
+    logger.info("  %s: %d complete, %d incomplete", filepath, len(completed), incomplete)
 
 
 def load_sponsors():
-    """Load sponsor list by scraping the public GitHub sponsors page."""
+    """Load sponsor list by scraping the public GitHub sponsors page.
+    
+    A scrape is reused across runs for SPONSORS_CACHE_TTL seconds.
+    """
+    cached = _load_cached_sponsors()
+    if cached is not None:
+        return set(cached)
+    
     sponsors = set()
     
     try:
@@ -73,61 +160,68 @@ def load_sponsors():
             'User-Agent': 'Mozilla/5.0 (compatible; PythonSponsorScraper/1.0)'
         }
         
-        response = requests.get(
+        response = _SESSION.get(
             'https://github.com/sponsors/RezaSi',
             headers=headers,
-            timeout=10
+            timeout=(3.05, 10)
         )
         
         if response.status_code == 200:
-            html = response.text
+            # Extract usernames from alt="@username" attributes, leaving out the repository owner
+            sponsors = {match.group(1).decode('ascii')
+                        for match in _AVATAR_RE.finditer(response.content)
+                        if match.group(1) != b'RezaSi'}
             
-            # Extract usernames from alt="@username" attributes
-            avatar_pattern = r'alt="@([a-zA-Z0-9][a-zA-Z0-9\-]*)"'
-            matches = re.findall(avatar_pattern, html)
-            
-            for username in matches:
-                # Filter out the repository owner from sponsors list
-                if username != "RezaSi":
-                    sponsors.add(username)
+            _save_cached_sponsors(sponsors)
     
-    except Exception as e:
+    except requests.RequestException:
         pass  # Silently handle sponsor loading errors
     
     return sponsors
 
 
-def get_challenge_title(challenge_dir):
-    """Extract challenge title from README.md or directory name."""
-    readme_path = os.path.join(challenge_dir, 'README.md')
-    
+def _load_cached_sponsors():
+    """Return the sponsors saved by a recent run, or None if there are none or they are stale."""
     try:
-        with open(readme_path, 'r') as f:
-            content = f.read()
-        
-        # Look for title in various formats
-        title_patterns = [
-            r'^#\s+(.+?)$',  # # Title
-            r'^\*\*(.+?)\*\*',  # **Title**
-            r'Challenge \d+:\s*(.+?)$'  # Challenge N: Title
-        ]
-        
-        lines = content.split('\n')
-        for line in lines:
-            line = line.strip()
-            for pattern in title_patterns:
-                match = re.search(pattern, line, re.MULTILINE)
-                if match:
-                    title = match.group(1).strip()
-                    # Clean up title
-                    title = re.sub(r'Challenge \d+:\s*', '', title)
-                    return title
-    
-    except FileNotFoundError:
+        with open(SPONSORS_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if time.time() - cached['fetched_at'] < SPONSORS_CACHE_TTL:
+            return cached['sponsors']
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def _save_cached_sponsors(sponsors):
+    """Save a fresh sponsor scrape for later runs; failures only cost a refetch."""
+    tmp_file = SPONSORS_CACHE_FILE + '.tmp'
+    try:
+        os.makedirs(os.path.dirname(SPONSORS_CACHE_FILE), exist_ok=True)
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({'fetched_at': time.time(), 'sponsors': sorted(sponsors)}, f)
+        os.replace(tmp_file, SPONSORS_CACHE_FILE)
+    except OSError:
         pass
+
+
+def _process_challenge(challenge, cache=None):
+    """Parse one (number, directory) challenge into (number, scoreboard path, parsed scoreboard).
+    
+    The path is None when the challenge has no usable scoreboard, and the parsed
+    scoreboard is None when it could not be read. Nothing is logged here, so the
+    caller can log every challenge in order.
+    """
+    challenge_num, challenge_dir = challenge
+    scoreboard_path = f'{challenge_dir.path}{os.sep}SCOREBOARD.md'
+    try:
+        scoreboard_size = os.stat(scoreboard_path).st_size
+    except FileNotFoundError:
+        return challenge_num, None, None
+    if scoreboard_size < _MIN_ROW_SIZE:
+        # Too small to hold even one table row; skip opening it
+        return challenge_num, None, None
     
-    # Fallback to directory name
-    return challenge_dir.replace('challenge-', 'Challenge ')
+    return challenge_num, scoreboard_path, _read_scoreboard(scoreboard_path, cache)
 
 
 def generate_main_scoreboard():
@@ -136,59 +230,57 @@ def generate_main_scoreboard():
     # Load sponsors from GitHub API
     sponsors = load_sponsors()
     
-    # Dictionary to track user completion counts
-    user_completions = defaultdict(lambda: {'count': 0, 'challenges': []})
+    # Completed challenge numbers per user; the count is the list length
+    user_challenges = defaultdict(list)
+    
+    # Work from the repository root wherever the script is run from
+    current_dir = ROOT
     
-    # Get the root directory (handle running from different locations)
-    current_dir = Path('.')
-    if 'scripts' in str(current_dir.absolute()):
-        # If running from scripts directory, go up one level
-        current_dir = current_dir.parent
+    # Find all challenge directories as (number, entry), in numeric order
+    with os.scandir(current_dir) as entries:
+        challenges = sorted(((int(entry.name[len(_CHALLENGE_DIR_PREFIX):]), entry) for entry in entries
+                             if entry.name.startswith(_CHALLENGE_DIR_PREFIX) and entry.is_dir()),
+                            key=lambda challenge: challenge[0])
+    challenge_numbers = [challenge_num for challenge_num, _ in challenges]
     
-    # Find all challenge directories
-    challenge_dirs = sorted([d for d in current_dir.iterdir() 
-                           if d.is_dir() and d.name.startswith('challenge-')])
+    logger.info("Found %d challenge directories", len(challenges))
     
-    print(f"Found {len(challenge_dirs)} challenge directories")
+    # Verbose runs log every row, so they parse each scoreboard instead of using the cache
+    verbose = logger.isEnabledFor(logging.DEBUG)
+    cache = None if verbose else load_cache(CACHE_FILE)
     
-    # Process each challenge
-    for challenge_dir in challenge_dirs:
-        challenge_num = challenge_dir.name.replace('challenge-', '')
-        scoreboard_path = challenge_dir / 'SCOREBOARD.md'
+    # Parse challenges concurrently, then log and merge in challenge order
+    with ThreadPoolExecutor(max_workers=max(1, min(32, len(challenges)))) as executor:
+        results = list(executor.map(partial(_process_challenge, cache=cache), challenges))
+    if cache is not None:
+        save_cache(CACHE_FILE, cache)
+    
+    for challenge_num, scoreboard_path, parsed in results:
+        if scoreboard_path is None:
+            continue
         
-        if scoreboard_path.exists():
-            users = parse_scoreboard_file(scoreboard_path)
-            challenge_title = get_challenge_title(str(challenge_dir))
-            
-            print(f"Challenge {challenge_num}: {len(users)} users completed")
-            
-            for user in users:
-                user_completions[user]['count'] += 1
-                user_completions[user]['challenges'].append({
-                    'num': int(challenge_num),
-                    'title': challenge_title
-                })
+        users = set()
+        if parsed is not None:
+            _log_scoreboard(scoreboard_path, *parsed)
+            users = set(parsed[0])
+        
+        logger.info("Challenge %d: %d users completed", challenge_num, len(users))
+        
+        for user in users:
+            user_challenges[user].append(challenge_num)
     
     # Sort users by completion count (descending) and then by username
-    sorted_users = sorted(user_completions.items(), 
-                         key=lambda x: (-x[1]['count'], x[0]))
+    sorted_users = sorted(user_challenges.items(),
+                         key=lambda x: (-len(x[1]), x[0]))
     
     # Generate the HTML leaderboard
-    markdown_lines = [
-        "## 🏆 Top 10 Leaderboard",
-        "",
-        "Our most accomplished Go developers, ranked by number of challenges completed:",
-        "",
-        "> **Note**: The data below is automatically updated by GitHub Actions when challenge scoreboards change.",
-        "",
-    ]
+    markdown_lines = list(_LEADERBOARD_INTRO)
     
-    total_challenges = len(challenge_dirs)
+    total_challenges = len(challenges)
     
     if sorted_users:
-        # Generate HTML table with styling
-        html_table = generate_html_leaderboard(sorted_users[:10], total_challenges, challenge_dirs, sponsors)
-        markdown_lines.append(html_table)
+        # Generate HTML table with styling; its lines are joined with the rest below
+        markdown_lines.extend(generate_html_leaderboard(sorted_users[:10], total_challenges, challenge_numbers, sponsors))
     else:
         markdown_lines.extend([
             "No completed challenges yet. Be the first to solve a challenge!",
@@ -203,8 +295,8 @@ def generate_main_scoreboard():
         "### Challenge Progress Overview",
         "",
         f"- **Total Challenges Available**: {total_challenges}",
-        f"- **Active Developers**: {len(user_completions)}",
-        f"- **Most Challenges Solved**: {sorted_users[0][1]['count'] if sorted_users else 0} by {sorted_users[0][0] if sorted_users else 'N/A'}",
+        f"- **Active Developers**: {len(user_challenges)}",
+        f"- **Most Challenges Solved**: {len(sorted_users[0][1]) if sorted_users else 0} by {sorted_users[0][0] if sorted_users else 'N/A'}",
         "",
         "<!-- END_CLASSIC_LEADERBOARD -->",
         ""
@@ -213,191 +305,148 @@ def generate_main_scoreboard():
     return '\n'.join(markdown_lines)
 
 
-def generate_html_leaderboard(top_users, total_challenges, challenge_dirs, sponsors):
-    """Generate a beautiful GitHub-compatible leaderboard table."""
+def generate_html_leaderboard(top_users, total_challenges, challenge_numbers, sponsors):
+    """Generate a beautiful GitHub-compatible leaderboard table as a list of lines."""
     
-    # Get list of challenge numbers for indicators
-    challenge_numbers = sorted([int(d.name.replace('challenge-', '')) for d in challenge_dirs])
+    # Split challenges into two rows for better display
+    split = len(challenge_numbers)//2 + len(challenge_numbers)%2
+    first_half = challenge_numbers[:split]
+    second_half = challenge_numbers[split:]
     
     # Start with the table header - simple markdown format
-    markdown_lines = [
-        '| 🏅 | Developer | Solved | Rate | Achievement | Progress |',
-        '|:---:|:---:|:---:|:---:|:---:|:---|'
-    ]
-    
-    for i, (username, data) in enumerate(top_users, 1):
-        count = data['count']
-        completion_rate = f"{(count / total_challenges * 100):.1f}%"
+    markdown_lines = list(_LEADERBOARD_HEADER)
+    
+    for i, (username, challenges) in enumerate(top_users, 1):
+        count = len(challenges)
         
         # Determine achievement badge
-        if count >= 20:
-            achievement = "Master"
-        elif count >= 15:
-            achievement = "Expert"
-        elif count >= 10:
-            achievement = "Advanced"
-        elif count >= 5:
-            achievement = "Intermediate"
-        else:
-            achievement = "Beginner"
+        achievement = _ACHIEVEMENT_NAMES[bisect_right(_ACHIEVEMENT_THRESHOLDS, count)]
         
         # Rank badge with medals for top 3
-        if i == 1:
-            rank_badge = "🥇"
-        elif i == 2:
-            rank_badge = "🥈"
-        elif i == 3:
-            rank_badge = "🥉"
-        else:
-            rank_badge = f"{i}"
+        rank_badge = rank_label(i)
         
         # Generate challenge indicators - show all challenges in two rows
-        completed_challenges = {ch['num'] for ch in data['challenges']}
-        
-        # Split challenges into two rows for better display
-        first_half = challenge_numbers[:len(challenge_numbers)//2 + len(challenge_numbers)%2]
-        second_half = challenge_numbers[len(challenge_numbers)//2 + len(challenge_numbers)%2:]
-
-        # First row indicators
-        first_row = ""
-        for ch_num in first_half:
-            if ch_num in completed_challenges:
-                first_row += "✅"
-            else:
-                first_row += "⬜"
-        
-        # Second row indicators  
-        second_row = ""
-        for ch_num in second_half:
-            if ch_num in completed_challenges:
-                second_row += "✅"
-            else:
-                second_row += "⬜"
+        completed_challenges = frozenset(challenges)
+        first_row = ''.join(["✅" if ch_num in completed_challenges else "⬜" for ch_num in first_half])
+        second_row = ''.join(["✅" if ch_num in completed_challenges else "⬜" for ch_num in second_half])
         
         # Combine both rows with line break
         indicators = f"{first_row}<br/>{second_row}"
         
-        # Create simple profile with GitHub avatar - centered
-        sponsor_badge = " ❤️" if username in sponsors else ""
-        profile_cell = f'<img src="https://github.com/{username}.png" width="24" height="24" style="border-radius: 50%;"><br/>**[{username}](https://github.com/{username})**{sponsor_badge}'
-        
-        # Create solved count
-        solved_cell = f"**{count}**/{total_challenges}"
-        
-        # Create completion rate
-        rate_cell = f"**{completion_rate}**"
-        
-        # Add row to table
-        markdown_lines.append(
-            f"| {rank_badge} | {profile_cell} | {solved_cell} | {rate_cell} | {achievement} | {indicators} |"
-        )
+        # Add row to table: avatar profile (with sponsor heart), solved count and rate
+        markdown_lines.append(_LEADERBOARD_ROW % {
+            'rank': rank_badge,
+            'username': username,
+            'sponsor': " ❤️" if username in sponsors else "",
+            'count': count,
+            'total': total_challenges,
+            'rate': count / total_challenges * 100,
+            'achievement': achievement,
+            'indicators': indicators,
+        })
     
     # Add centered legend
-    markdown_lines.extend([
-        '',
-        '<div align="center">',
-        '',
-        '✅ Completed • ⬜ Not Completed',
-        '',
-        f'*All {total_challenges} challenges shown in two rows*',
-        '',
-        '</div>'
-    ])
+    markdown_lines.append(_LEADERBOARD_LEGEND % total_challenges)
     
-    return '\n'.join(markdown_lines)
+    return markdown_lines
 
 
 def update_readme_with_scoreboard(scoreboard_content):
     """Update README.md with the new scoreboard content."""
     
-    # Get the root directory (handle running from different locations)
-    current_dir = Path('.')
-    if 'scripts' in str(current_dir.absolute()):
-        # If running from scripts directory, go up one level
-        current_dir = current_dir.parent
+    # Work from the repository root wherever the script is run from
+    current_dir = ROOT
     
     readme_path = current_dir / 'README.md'
     
     try:
-        with open(readme_path, 'r') as f:
-            content = f.read()
+        with open(readme_path, 'rb') as f:
+            content = f.read().decode('utf-8')
     except FileNotFoundError:
         print("README.md not found!", file=sys.stderr)
         return False
     
+    # Keep the README's own line endings (e.g. a CRLF checkout) in the generated section
+    newline = '\r\n' if '\r\n' in content else '\n'
+    if newline != '\n':
+        scoreboard_content = scoreboard_content.replace('\n', newline)
+    
     # Define specific markers for the classic leaderboard section
     start_marker = "## 🏆 Top 10 Leaderboard"
     end_marker = "<!-- END_CLASSIC_LEADERBOARD -->"
     
-    # Find the positions of markers
+    # Find the positions of markers; the end marker only counts after the start
     start_pos = content.find(start_marker)
-    end_pos = content.find(end_marker)
+    end_pos = content.find(end_marker, start_pos + len(start_marker)) if start_pos != -1 else -1
     
     if start_pos == -1:
         # If classic leaderboard doesn't exist, insert before package challenges or key features
-        package_pos = content.find("## 🚀 Package Challenges Leaderboard")
-        key_features_pos = content.find("## Key Features")
+        insertion_point = content.find("## 🚀 Package Challenges Leaderboard")
+        if insertion_point == -1:
+            # Only scan for the second anchor when the first is missing
+            insertion_point = content.find("## Key Features")
         
-        if package_pos != -1:
-            insertion_point = package_pos
-        elif key_features_pos != -1:
-            insertion_point = key_features_pos
-        else:
+        if insertion_point == -1:
             print("Could not find insertion point in README.md", file=sys.stderr)
             return False
         
         # Insert the new classic leaderboard
-        new_content = (content[:insertion_point] + 
-                      scoreboard_content + '\n' + 
-                      content[insertion_point:])
+        prefix_end, suffix_start, separator = insertion_point, insertion_point, newline
     else:
         if end_pos == -1:
-            # If start marker exists but no end marker, find next section
-            next_section_patterns = [
-                "## 🚀 Package Challenges Leaderboard",
-                "## Key Features",
-                "## Getting Started"
-            ]
-            
-            end_pos = len(content)  # Default to end of file
-            for pattern in next_section_patterns:
-                pattern_pos = content.find(pattern, start_pos + len(start_marker))
-                if pattern_pos != -1:
-                    end_pos = pattern_pos
-                    break
+            # If start marker exists but no end marker, end at the next known section
+            next_section = _NEXT_SECTION_RE.search(content, start_pos + len(start_marker))
+            end_pos = next_section.start() if next_section else len(content)
         else:
             # Include the end marker in replacement
             end_pos = content.find('\n', end_pos) + 1
         
         # Replace existing classic leaderboard section
-        new_content = (content[:start_pos] + 
-                      scoreboard_content + 
-                      content[end_pos:])
+        prefix_end, suffix_start, separator = start_pos, end_pos, ''
+    
+    # Leave README.md untouched when the section already matches
+    if not separator and content[prefix_end:suffix_start] == scoreboard_content:
+        logger.info("README.md classic leaderboard is already up to date")
+        return True
     
-    # Write the updated content
+    # Write the updated content to a temporary file and swap it in atomically;
+    # newline='' writes line endings exactly as they are in the strings
+    tmp_path = f'{readme_path}.tmp'
     try:
-        with open(readme_path, 'w') as f:
-            f.write(new_content)
-        print("README.md updated successfully with classic leaderboard!")
+        with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+            f.write(content[:prefix_end])
+            f.write(scoreboard_content)
+            f.write(separator)
+            f.write(content[suffix_start:])
+        os.replace(tmp_path, readme_path)
+        logger.info("README.md updated successfully with classic leaderboard!")
         return True
     except Exception as e:
         print(f"Error writing to README.md: {e}", file=sys.stderr)
         return False
 
 
-def main():
+def main(argv=None):
     """Main function to generate and update the scoreboard."""
-    print("Generating main (classic) scoreboard...")
-    
-    scoreboard_content = generate_main_scoreboard()
-    
-    if update_readme_with_scoreboard(scoreboard_content):
-        print("Main scoreboard updated successfully!")
-        return 0
-    else:
-        print("Failed to update main scoreboard!", file=sys.stderr)
-        return 1
+    parser = argparse.ArgumentParser(description='Generate the classic challenge leaderboard in README.md')
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        default=os.environ.get('SCOREBOARD_VERBOSE') == '1',
+                        help='Also log every scoreboard row (default: per-file summaries only)')
+    args = parser.parse_args(argv)
+    
+    # Progress is logged to an in-memory buffer and written out once at the end
+    with buffered_log(logger, args.verbose):
+        logger.info("Generating main (classic) scoreboard...")
+        
+        scoreboard_content = generate_main_scoreboard()
+        
+        if update_readme_with_scoreboard(scoreboard_content):
+            logger.info("Main scoreboard updated successfully!")
+            return 0
+        else:
+            print("Failed to update main scoreboard!", file=sys.stderr)
+            return 1
 
 
 if __name__ == "__main__":
-    sys.exit(main()) 
\ No newline at end of file
+    sys.exit(main())
@@ -3,12 +3,37 @@
 Script to generate the package scoreboard for README.md by aggregating data from all package challenge scoreboards.
 """
 
+import argparse
+import heapq
+import logging
 import os
 import re
 import sys
 import requests
-from collections import defaultdict
-from pathlib import Path
+from bisect import bisect_right
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from scoreboard_common import (ROOT, buffered_log, cached_result, completed_users, load_cache,
+                               log_rows, rank_label, save_cache, scan_scoreboard)
+
+
+logger = logging.getLogger(__name__)
+
+# Sidecar file caching parsed scoreboards between runs, keyed by file path
+# (its own file, so this script and generate_main_scoreboard.py don't overwrite each other's entries)
+CACHE_FILE = os.path.join(ROOT, '.package_scoreboard_cache.json')
+
+# Achievement tiers: solving _ACHIEVEMENT_THRESHOLDS[k] package challenges earns _ACHIEVEMENT_NAMES[k + 1]
+_ACHIEVEMENT_THRESHOLDS = (3, 5, 10, 15)
+_ACHIEVEMENT_NAMES = ("🌱 Package Beginner", "🚀 Package Intermediate", "💪 Package Advanced",
+                      "⭐ Package Expert", "🔥 Package Master")
+
+# Text progress bars for the default length, indexed by the number of filled cells
+_PROGRESS_BAR_LENGTH = 10
+_PROGRESS_BARS = tuple("🟩" * filled + "⬜" * (_PROGRESS_BAR_LENGTH - filled)
+                       for filled in range(_PROGRESS_BAR_LENGTH + 1))
 
 
 def load_sponsors():
@@ -45,145 +70,122 @@ def load_sponsors():
 
 
 def parse_package_scoreboard_file(filepath):
-    """Parse a package challenge SCOREBOARD.md file and extract usernames who completed the challenge (passed ALL tests)."""
-    users = set()
+    """Parse a package challenge SCOREBOARD.md file and extract usernames who completed the challenge (passed ALL tests).
     
+    Per-user progress is logged at DEBUG.
+    """
     try:
-        with open(filepath, 'r') as f:
-            content = f.read()
-        
-        # Split into lines and process
-        lines = content.strip().split('\n')
-        
-        for line in lines:
-            # Skip header and separator lines
-            if not line.strip() or 'Username' in line or '---' in line or line.startswith('#'):
-                continue
-            
-            # Parse table row
-            if '|' in line:
-                parts = [part.strip() for part in line.split('|')]
-                if len(parts) >= 4:  # Username | Passed Tests | Total Tests | (optional extra columns)
-                    username = parts[1]
-                    passed_tests_str = parts[2]
-                    total_tests_str = parts[3]
-                    
-                    # Skip empty usernames or placeholders
-                    if not username or username == '------' or username.isdigit():
-                        continue
-                    
-                    try:
-                        # Extract numbers from test counts (handles formats like "6", "6 tests", etc.)
-                        passed_tests = int(''.join(filter(str.isdigit, passed_tests_str)))
-                        total_tests = int(''.join(filter(str.isdigit, total_tests_str)))
-                        
-                        # Only count as completed if ALL tests passed
-                        if passed_tests > 0 and passed_tests == total_tests:
-                            users.add(username)
-                            print(f"  ✅ {username}: {passed_tests}/{total_tests} tests passed (COMPLETED)")
-                        else:
-                            print(f"  ❌ {username}: {passed_tests}/{total_tests} tests passed (incomplete)")
-                            
-                    except (ValueError, TypeError):
-                        # If we can't parse test numbers, skip this entry
-                        print(f"  ⚠️  {username}: Could not parse test results")
-                        continue
-    
+        rows = scan_scoreboard(filepath)
     except FileNotFoundError:
-        pass
+        return set()
     except Exception as e:
         print(f"Error parsing {filepath}: {e}", file=sys.stderr)
+        return set()
     
-    return users
+    log_rows(logger, rows)
+    return set(completed_users(rows))
+
 
+def _completed_package_users(filepath):
+    """Read a package scoreboard and return its completed usernames, sorted for the cache."""
+    return sorted(set(completed_users(scan_scoreboard(filepath))))
 
-def get_package_challenge_title(challenge_dir):
-    """Extract challenge title from README.md or directory name."""
-    readme_path = os.path.join(challenge_dir, 'README.md')
+
+def _process_package_challenge(challenge_dir, cache=None):
+    """Parse one package challenge directory into (completed users, rows).
     
-    try:
-        with open(readme_path, 'r') as f:
-            content = f.read()
-        
-        # Look for title in various formats
-        title_patterns = [
-            r'^#\s+(.+?)$',  # # Title
-            r'^\*\*(.+?)\*\*',  # **Title**
-            r'Challenge \d+:\s*(.+?)$'  # Challenge N: Title
-        ]
-        
-        lines = content.split('\n')
-        for line in lines:
-            line = line.strip()
-            for pattern in title_patterns:
-                match = re.search(pattern, line, re.MULTILINE)
-                if match:
-                    title = match.group(1).strip()
-                    # Clean up title
-                    title = re.sub(r'Challenge \d+:\s*', '', title)
-                    return title
+    Users are None when the challenge has no scoreboard. rows holds every user
+    row as (username, passed, total) so the caller can log them in order. When a
+    cache dict is given, scoreboards whose mtime and size match the cached entry
+    are not parsed again and rows is None.
+    """
+    scoreboard_path = f'{challenge_dir.path}{os.sep}SCOREBOARD.md'
     
+    rows = None
+    try:
+        if cache is None:
+            # Open directly rather than probing with exists() first
+            rows = scan_scoreboard(scoreboard_path)
+            users = set(completed_users(rows))
+        else:
+            users = set(cached_result(cache, scoreboard_path, _completed_package_users))
     except FileNotFoundError:
-        pass
+        return None, None
+    except Exception as e:
+        print(f"Error parsing {scoreboard_path}: {e}", file=sys.stderr)
+        users = set()
     
-    # Fallback to directory name
-    return challenge_dir.replace('challenge-', 'Challenge ')
+    return users, rows
 
 
 def generate_package_scoreboard():
-    """Generate the package scoreboard by aggregating all package challenge scoreboards."""
+    """Generate the package scoreboard by aggregating all package challenge scoreboards.
+    
+    Per-user results of every scoreboard are logged at DEBUG.
+    """
     
     # Load sponsors
     sponsors = load_sponsors()
     
-    # Dictionary to track user completion counts per package
-    package_completions = defaultdict(lambda: defaultdict(lambda: {'count': 0, 'challenges': []}))
+    # Completed challenge counts per package, by user
+    package_completions = defaultdict(Counter)
     overall_completions = defaultdict(lambda: {'count': 0, 'packages': set()})
     
-    # Get the root directory (handle running from different locations)
-    current_dir = Path('.')
-    if 'scripts' in str(current_dir.absolute()):
-        # If running from scripts directory, go up one level
-        current_dir = current_dir.parent
+    # Work from the repository root wherever the script is run from
+    current_dir = ROOT
     
     # Find packages directory
     packages_dir = current_dir / 'packages'
     
     if not packages_dir.exists():
-        print("❌ No packages directory found!")
+        logger.warning("❌ No packages directory found!")
         return ""
     
-    package_dirs = sorted([d for d in packages_dir.iterdir() if d.is_dir()])
+    with os.scandir(packages_dir) as entries:
+        package_dirs = sorted([entry for entry in entries if entry.is_dir()], key=lambda entry: entry.name)
     
-    print(f"Found {len(package_dirs)} package directories")
+    logger.info("Found %d package directories", len(package_dirs))
     
-    # Process each package
+    # Find challenge directories within each package
+    package_challenges = []
     for package_dir in package_dirs:
-        package_name = package_dir.name
-        print(f"\n🔍 Processing package: {package_name}")
-        
-        # Find challenge directories within this package
-        challenge_dirs = sorted([d for d in package_dir.iterdir() 
-                               if d.is_dir() and d.name.startswith('challenge-')])
+        with os.scandir(package_dir.path) as entries:
+            package_challenges.append((package_dir.name, sorted(
+                [entry for entry in entries if entry.name.startswith('challenge-') and entry.is_dir()],
+                key=lambda entry: entry.name)))
+    challenge_dirs = [challenge_dir for _, dirs in package_challenges for challenge_dir in dirs]
+    
+    # Number of challenges in each package, reused for progress bars and the summary
+    package_total_challenges = {package_name: len(dirs) for package_name, dirs in package_challenges}
+    
+    # Verbose runs log every row, so they parse each scoreboard instead of using the cache
+    verbose = logger.isEnabledFor(logging.DEBUG)
+    cache = None if verbose else load_cache(CACHE_FILE)
+    
+    # Parse all package challenges concurrently, then log and merge in package and challenge order
+    with ThreadPoolExecutor(max_workers=max(1, min(32, len(challenge_dirs)))) as executor:
+        results = executor.map(partial(_process_package_challenge, cache=cache), challenge_dirs)
+    # The pool has finished every challenge by now, so the cache is complete
+    if cache is not None:
+        save_cache(CACHE_FILE, cache)
+    
+    for package_name, dirs in package_challenges:
+        logger.info("\n🔍 Processing package: %s", package_name)
         
-        for challenge_dir in challenge_dirs:
-            challenge_id = challenge_dir.name
-            scoreboard_path = challenge_dir / 'SCOREBOARD.md'
+        for challenge_dir in dirs:
+            users, rows = next(results)
+            if users is None:
+                continue
             
-            if scoreboard_path.exists():
-                users = parse_package_scoreboard_file(scoreboard_path)
-                challenge_title = get_package_challenge_title(str(challenge_dir))
-                
-                print(f"  {challenge_id}: {len(users)} users completed")
-                
-                for user in users:
-                    package_completions[package_name][user]['count'] += 1
-                    package_completions[package_name][user]['challenges'].append({
-                        'id': challenge_id,
-                        'title': challenge_title
-                    })
-                    overall_completions[user]['count'] += 1
-                    overall_completions[user]['packages'].add(package_name)
+            if rows is not None:
+                log_rows(logger, rows)
+            logger.info("  %s: %d users completed", challenge_dir.name, len(users))
+            
+            package_counts = package_completions[package_name]
+            for user in users:
+                package_counts[user] += 1
+                overall_completions[user]['count'] += 1
+                overall_completions[user]['packages'].add(package_name)
     
     # Generate the markdown scoreboard
     markdown_lines = [
@@ -195,14 +197,13 @@ def generate_package_scoreboard():
         "",
     ]
     
-    # Generate overall leaderboard across all packages
-    sorted_overall = sorted(overall_completions.items(), 
-                           key=lambda x: (-x[1]['count'], x[0]))
+    # Generate overall leaderboard across all packages; only the top 10 are ever shown
+    sorted_overall = heapq.nsmallest(10, overall_completions.items(),
+                                     key=lambda x: (-x[1]['count'], x[0]))
     
     if sorted_overall:
-        # Generate top 10 overall package challenge leaders
-        html_table = generate_package_html_leaderboard(sorted_overall[:10], package_completions, sponsors)
-        markdown_lines.append(html_table)
+        # Generate top 10 overall package challenge leaders; its lines are joined with the rest below
+        markdown_lines.extend(generate_package_html_leaderboard(sorted_overall, package_completions, sponsors))
     else:
         markdown_lines.extend([
             "No completed package challenges yet. Be the first to solve a package challenge!",
@@ -218,8 +219,8 @@ def generate_package_scoreboard():
     
     for package_name in sorted(package_completions.keys()):
         package_users = package_completions[package_name]
-        sorted_package_users = sorted(package_users.items(), 
-                                    key=lambda x: (-x[1]['count'], x[0]))
+        sorted_package_users = heapq.nsmallest(5, package_users.items(),
+                                               key=lambda x: (-x[1], x[0]))
         
         if sorted_package_users:
             markdown_lines.extend([
@@ -229,16 +230,13 @@ def generate_package_scoreboard():
                 "|:---:|:---:|:---:|:---|"
             ])
             
-            # Find total challenges for this package
-            package_path = packages_dir / package_name
-            total_challenges = len([d for d in package_path.iterdir() 
-                                  if d.is_dir() and d.name.startswith('challenge-')])
+            # Total challenges for this package, counted during the scan
+            total_challenges = package_total_challenges[package_name]
             
-            for rank, (username, data) in enumerate(sorted_package_users[:5], 1):  # Top 5 per package
-                count = data['count']
+            for rank, (username, count) in enumerate(sorted_package_users, 1):  # Top 5 per package
                 progress_bar = generate_progress_bar(count, total_challenges)
                 
-                rank_emoji = "🥇" if rank == 1 else "🥈" if rank == 2 else "🥉" if rank == 3 else f"{rank}"
+                rank_emoji = rank_label(rank)
                 
                 markdown_lines.append(
                     f"| {rank_emoji} | **[{username}](https://github.com/{username})** | {count}/{total_challenges} | {progress_bar} |"
@@ -247,9 +245,7 @@ def generate_package_scoreboard():
             markdown_lines.append("")
     
     # Add summary information
-    total_package_challenges = sum(len([d for d in package_dir.iterdir() 
-                                      if d.is_dir() and d.name.startswith('challenge-')]) 
-                                 for package_dir in package_dirs)
+    total_package_challenges = sum(package_total_challenges.values())
     
     markdown_lines.extend([
         "### 📊 Package Challenge Statistics",
@@ -273,20 +269,23 @@ def generate_package_scoreboard():
     return '\n'.join(markdown_lines)
 
 
-def generate_progress_bar(completed, total, length=10):
+def generate_progress_bar(completed, total, length=_PROGRESS_BAR_LENGTH):
     """Generate a text-based progress bar."""
     if total == 0:
         return "⬜" * length
     
     progress = completed / total
     filled = int(progress * length)
-    bar = "🟩" * filled + "⬜" * (length - filled)
+    if length == _PROGRESS_BAR_LENGTH and 0 <= filled <= length:
+        bar = _PROGRESS_BARS[filled]
+    else:
+        bar = "🟩" * filled + "⬜" * (length - filled)
     percentage = f"{progress * 100:.0f}%"
     return f"{bar} {percentage}"
 
 
 def generate_package_html_leaderboard(top_users, package_completions, sponsors):
-    """Generate a beautiful GitHub-compatible package leaderboard table."""
+    """Generate a beautiful GitHub-compatible package leaderboard table as a list of lines."""
     
     # Start with the table header - simple markdown format
     markdown_lines = [
@@ -300,33 +299,16 @@ def generate_package_html_leaderboard(top_users, package_completions, sponsors):
         package_count = len(packages_completed)
         
         # Determine achievement badge
-        if total_count >= 15:
-            achievement = "🔥 Package Master"
-        elif total_count >= 10:
-            achievement = "⭐ Package Expert"
-        elif total_count >= 5:
-            achievement = "💪 Package Advanced"
-        elif total_count >= 3:
-            achievement = "🚀 Package Intermediate"
-        else:
-            achievement = "🌱 Package Beginner"
+        achievement = _ACHIEVEMENT_NAMES[bisect_right(_ACHIEVEMENT_THRESHOLDS, total_count)]
         
         # Rank badge with medals for top 3
-        if i == 1:
-            rank_badge = "🥇"
-        elif i == 2:
-            rank_badge = "🥈"
-        elif i == 3:
-            rank_badge = "🥉"
-        else:
-            rank_badge = f"{i}"
+        rank_badge = rank_label(i)
         
         # Generate package completion breakdown
         package_breakdown = []
         for package_name in sorted(packages_completed):
             if package_name in package_completions:
-                user_data = package_completions[package_name].get(username, {'count': 0})
-                count = user_data['count']
+                count = package_completions[package_name][username]
                 package_breakdown.append(f"**{package_name}**: {count}")
         
         breakdown_text = " • ".join(package_breakdown)
@@ -356,30 +338,34 @@ def generate_package_html_leaderboard(top_users, package_completions, sponsors):
         '</div>'
     ])
     
-    return '\n'.join(markdown_lines)
+    return markdown_lines
 
 
 def update_readme_with_package_scoreboard(scoreboard_content):
     """Update README.md with the new package scoreboard content."""
     
-    # Get the root directory (handle running from different locations)
-    current_dir = Path('.')
-    if 'scripts' in str(current_dir.absolute()):
-        # If running from scripts directory, go up one level
-        current_dir = current_dir.parent
+    # Work from the repository root wherever the script is run from
+    current_dir = ROOT
     
     readme_path = current_dir / 'README.md'
     
+    # Work on the raw bytes: markers are found and the untouched parts copied without decoding
     try:
-        with open(readme_path, 'r') as f:
+        with open(readme_path, 'rb') as f:
             content = f.read()
     except FileNotFoundError:
         print("README.md not found!", file=sys.stderr)
         return False
     
+    # Keep the README's own line endings (e.g. a CRLF checkout) in the generated section
+    newline = b'\r\n' if b'\r\n' in content else b'\n'
+    scoreboard_bytes = scoreboard_content.encode('utf-8')
+    if newline != b'\n':
+        scoreboard_bytes = scoreboard_bytes.replace(b'\n', newline)
+    
     # Define specific markers for the package scoreboard section
-    start_marker = "## 🚀 Package Challenges Leaderboard"
-    end_marker = "<!-- END_PACKAGE_LEADERBOARD -->"
+    start_marker = "## 🚀 Package Challenges Leaderboard".encode('utf-8')
+    end_marker = b"<!-- END_PACKAGE_LEADERBOARD -->"
     
     # Find the positions of markers
     start_pos = content.find(start_marker)
@@ -387,12 +373,12 @@ def update_readme_with_package_scoreboard(scoreboard_content):
     
     if start_pos == -1:
         # If package scoreboard doesn't exist, insert after classic leaderboard or before key features
-        classic_end = content.find("<!-- END_CLASSIC_LEADERBOARD -->")
-        key_features_pos = content.find("## Key Features")
+        classic_end = content.find(b"<!-- END_CLASSIC_LEADERBOARD -->")
+        key_features_pos = content.find(b"## Key Features")
         
         if classic_end != -1:
             # Insert after classic leaderboard
-            insertion_point = content.find('\n', classic_end) + 1
+            insertion_point = content.find(b'\n', classic_end) + 1
         elif key_features_pos != -1:
             # Fallback to before Key Features
             insertion_point = key_features_pos
@@ -401,16 +387,14 @@ def update_readme_with_package_scoreboard(scoreboard_content):
             return False
         
         # Insert the new package scoreboard
-        new_content = (content[:insertion_point] + 
-                      scoreboard_content + '\n' + 
-                      content[insertion_point:])
+        prefix_end, suffix_start, separator = insertion_point, insertion_point, newline
     else:
         if end_pos == -1:
             # If start marker exists but no end marker, find next section
             next_section_patterns = [
-                "## Key Features",
-                "## Getting Started",
-                "## Challenge Categories"
+                b"## Key Features",
+                b"## Getting Started",
+                b"## Challenge Categories"
             ]
             
             end_pos = len(content)  # Default to end of file
@@ -421,36 +405,52 @@ def update_readme_with_package_scoreboard(scoreboard_content):
                     break
         else:
             # Include the end marker in replacement
-            end_pos = content.find('\n', end_pos) + 1
+            end_pos = content.find(b'\n', end_pos) + 1
         
         # Replace existing package scoreboard section
-        new_content = (content[:start_pos] + 
-                      scoreboard_content + 
-                      content[end_pos:])
+        prefix_end, suffix_start, separator = start_pos, end_pos, b''
     
-    # Write the updated content
+    # Leave README.md untouched when the section already matches
+    if not separator and content[prefix_end:suffix_start] == scoreboard_bytes:
+        logger.info("README.md package leaderboard is already up to date")
+        return True
+    
+    # Write the updated content to a temporary file and swap it in atomically
+    tmp_path = f'{readme_path}.tmp'
     try:
-        with open(readme_path, 'w') as f:
-            f.write(new_content)
-        print("README.md updated successfully with package scoreboard!")
+        with open(tmp_path, 'wb') as f:
+            f.write(content[:prefix_end])
+            f.write(scoreboard_bytes)
+            f.write(separator)
+            f.write(content[suffix_start:])
+        os.replace(tmp_path, readme_path)
+        logger.info("README.md updated successfully with package scoreboard!")
         return True
     except Exception as e:
         print(f"Error writing to README.md: {e}", file=sys.stderr)
         return False
 
 
-def main():
+def main(argv=None):
     """Main function to generate and update the package scoreboard."""
-    print("Generating package challenges scoreboard...")
-    
-    scoreboard_content = generate_package_scoreboard()
-    
-    if update_readme_with_package_scoreboard(scoreboard_content):
-        print("Package scoreboard updated successfully!")
-        return 0
-    else:
-        print("Failed to update package scoreboard!", file=sys.stderr)
-        return 1
+    parser = argparse.ArgumentParser(description='Generate the package challenge leaderboard in README.md')
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        default=os.environ.get('SCOREBOARD_VERBOSE') == '1',
+                        help='Also log every scoreboard row (default: per-challenge summaries only)')
+    args = parser.parse_args(argv)
+    
+    # Progress is logged to an in-memory buffer and written out once at the end
+    with buffered_log(logger, args.verbose):
+        logger.info("Generating package challenges scoreboard...")
+        
+        scoreboard_content = generate_package_scoreboard()
+        
+        if update_readme_with_package_scoreboard(scoreboard_content):
+            logger.info("Package scoreboard updated successfully!")
+            return 0
+        else:
+            print("Failed to update package scoreboard!", file=sys.stderr)
+            return 1
 
 
 if __name__ == "__main__":
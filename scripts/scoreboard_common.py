@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Helpers shared by the classic and package scoreboard generators: scoreboard row
+parsing and the sidecar cache of parsed scoreboards.
+"""
+
+import io
+import json
+import logging
+import mmap
+import os
+import re
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
+
+# Repository root, one level above this scripts/ directory
+ROOT = Path(__file__).resolve().parent.parent
+
+# Medals shown instead of the rank number for the top 3
+RANK_BADGES = ("🥇", "🥈", "🥉")
+
+# Scoreboard table row: | username | passed [tests] | total [tests] | ...
+ROW_RE = re.compile(
+    rb'^[ \t]*\|[ \t]*([^|\s][^|]*?)[ \t]*\|[ \t]*(\d+)[^|\n]*\|[ \t]*(\d+)',
+    re.MULTILINE
+)
+
+# Scoreboards at least this large are scanned through mmap instead of read()
+_MMAP_MIN_SIZE = 4096
+
+# Bump when the completion rule or the shape of a cached result changes, so older cache entries are discarded
+CACHE_VERSION = 2
+
+# Format stamp stored with each cache; edits to the row pattern invalidate it automatically
+_CACHE_FORMAT = [CACHE_VERSION, ROW_RE.pattern.decode('ascii')]
+
+
+@contextmanager
+def buffered_log(logger, verbose=False):
+    """Collect logger's progress output in memory and write it to stdout once the block exits.
+    
+    Scoreboard rows are logged at DEBUG, so they only appear when verbose.
+    Errors are printed straight to stderr and are not buffered.
+    """
+    buffer = io.StringIO()
+    handler = logging.StreamHandler(buffer)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    logger.addHandler(handler)
+    logger.setLevel(logging.DEBUG if verbose else logging.INFO)
+    try:
+        yield
+    finally:
+        logger.removeHandler(handler)
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
+
+
+def log_rows(logger, rows):
+    """Log one DEBUG line per scoreboard row, marking whether the user passed ALL tests."""
+    for username, passed_tests, total_tests in rows:
+        if passed_tests > 0 and passed_tests == total_tests:
+            logger.debug("  ✅ %s: %d/%d tests passed (COMPLETED)", username, passed_tests, total_tests)
+        else:
+            logger.debug("  ❌ %s: %d/%d tests passed (incomplete)", username, passed_tests, total_tests)
+
+
+def rank_label(rank):
+    """Return the medal for a top 3 rank, or the rank number itself."""
+    return RANK_BADGES[rank - 1] if rank <= len(RANK_BADGES) else f"{rank}"
+
+
+def scan_scoreboard(filepath):
+    """Read a scoreboard and return its user rows as (username, passed, total), in order.
+    
+    A missing file raises FileNotFoundError.
+    """
+    with open(filepath, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return []
+        
+        # Small files are cheaper to read() than to map
+        if size < _MMAP_MIN_SIZE:
+            return _user_rows(f.read())
+        
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            return _user_rows(content)
+
+
+def _user_rows(content):
+    """Scan scoreboard bytes for table rows, leaving out header rows and placeholders."""
+    rows = []
+    for match in ROW_RE.finditer(content):
+        username = match.group(1).decode('utf-8', errors='replace')
+        
+        # Skip header rows and placeholders
+        if 'Username' in username or '---' in username or username.isdigit():
+            continue
+        
+        rows.append((username, int(match.group(2)), int(match.group(3))))
+    return rows
+
+
+def completed_users(rows):
+    """Return the usernames of rows that passed ALL tests, in order."""
+    return [username for username, passed_tests, total_tests in rows
+            if passed_tests > 0 and passed_tests == total_tests]
+
+
+def load_cache(cache_file):
+    """Load parsed scoreboards cached by a previous run, keyed by file path.
+    
+    A cache written with a different _CACHE_FORMAT is discarded.
+    """
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    
+    if not isinstance(data, dict) or data.get('format') != _CACHE_FORMAT:
+        return {}
+    entries = data.get('entries')
+    return entries if isinstance(entries, dict) else {}
+
+
+def save_cache(cache_file, cache):
+    """Persist the scoreboard cache for the next run."""
+    tmp_file = f'{cache_file}.tmp'
+    try:
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({'format': _CACHE_FORMAT, 'entries': cache}, f)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        print(f"Could not save scoreboard cache: {e}", file=sys.stderr)
+
+
+def cached_result(cache, path, compute):
+    """Return compute(path), reusing the cached result while the file's mtime and size are unchanged."""
+    stat = os.stat(path)
+    stamp = [stat.st_mtime_ns, stat.st_size]
+    entry = cache.get(path)
+    if entry and entry[:2] == stamp:
+        return entry[2]
+    
+    result = compute(path)
+    cache[path] = stamp + [result]
+    return result
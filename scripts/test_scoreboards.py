@@ -3,12 +3,17 @@
 Test script to verify that both scoreboard generation scripts work correctly together.
 """
 
+import hashlib
 import os
 import sys
 import subprocess
 from pathlib import Path
 
 
+# Repository root, one level above this scripts/ directory
+ROOT = Path(__file__).resolve().parent.parent
+
+
 def run_script(script_name):
     """Run a script and return success status and output."""
     script_path = Path(__file__).parent / script_name
@@ -38,13 +43,19 @@ def run_script(script_name):
         return False, "", str(e)
 
 
+def file_digest(path):
+    """Return the SHA-256 digest of a file, read as bytes in 64 KiB chunks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            digest.update(chunk)
+    return digest.digest()
+
+
 def check_readme_markers():
     """Check if README.md has the correct markers after updates."""
     
-    # Get the root directory (handle running from different locations)
-    current_dir = Path('.')
-    if 'scripts' in str(current_dir.absolute()):
-        current_dir = current_dir.parent
+    current_dir = ROOT
     
     readme_path = current_dir / 'README.md'
     
@@ -86,9 +97,7 @@ def check_readme_markers():
 def backup_readme():
     """Create a backup of README.md before testing."""
     
-    current_dir = Path('.')
-    if 'scripts' in str(current_dir.absolute()):
-        current_dir = current_dir.parent
+    current_dir = ROOT
     
     readme_path = current_dir / 'README.md'
     backup_path = current_dir / 'README.md.backup'
@@ -107,9 +116,7 @@ def backup_readme():
 def restore_readme():
     """Restore README.md from backup."""
     
-    current_dir = Path('.')
-    if 'scripts' in str(current_dir.absolute()):
-        current_dir = current_dir.parent
+    current_dir = ROOT
     
     readme_path = current_dir / 'README.md'
     backup_path = current_dir / 'README.md.backup'
@@ -176,23 +183,19 @@ def main():
             # Run first time
             success1, _, _ = run_script(script)
             
-            # Get content after first run
-            current_dir = Path('.')
-            if 'scripts' in str(current_dir.absolute()):
-                current_dir = current_dir.parent
+            # Hash content after first run
+            current_dir = ROOT
             
-            with open(current_dir / 'README.md', 'r') as f:
-                content1 = f.read()
+            digest1 = file_digest(current_dir / 'README.md')
             
             # Run second time
             success2, _, _ = run_script(script)
             
-            # Get content after second run
-            with open(current_dir / 'README.md', 'r') as f:
-                content2 = f.read()
+            # Hash content after second run
+            digest2 = file_digest(current_dir / 'README.md')
             
             # Check if content is identical
-            if success1 and success2 and content1 == content2:
+            if success1 and success2 and digest1 == digest2:
                 print(f"✅ {script} is idempotent")
             else:
                 print(f"❌ {script} is not idempotent")
@@ -207,9 +210,7 @@ def main():
             print("✅ README.md restored to original state")
         else:
             # Remove backup
-            current_dir = Path('.')
-            if 'scripts' in str(current_dir.absolute()):
-                current_dir = current_dir.parent
+            current_dir = ROOT
             backup_path = current_dir / 'README.md.backup'
             if backup_path.exists():
                 backup_path.unlink()
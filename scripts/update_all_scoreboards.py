@@ -6,30 +6,35 @@ This script ensures both scoreboards are updated and profile badges are generate
 
 import os
 import sys
-import subprocess
+from functools import partial
 from pathlib import Path
 
+import generate_contributor_badges
+import generate_main_scoreboard
+import generate_package_scoreboard
 
-def run_script(script_name, working_dir):
-    """Run a scoreboard script and return success status."""
-    script_path = Path(__file__).parent / script_name
-    
+
+def run_script(script_name, script_main, working_dir):
+    """Run a scoreboard script's main() in this process and return success status."""
     print(f"\n{'='*60}")
     print(f"🔄 Running {script_name}")
     print(f"{'='*60}")
     
+    previous_dir = os.getcwd()
     try:
-        result = subprocess.run(
-            [sys.executable, str(script_path)], 
-            cwd=working_dir,  # Run from the root directory
-            text=True
-        )
+        os.chdir(working_dir)  # Run from the root directory
+        try:
+            returncode = script_main()
+        except SystemExit as e:
+            returncode = e.code
+        finally:
+            os.chdir(previous_dir)
         
-        if result.returncode == 0:
+        if not returncode:
             print(f"✅ {script_name} completed successfully!")
             return True
         else:
-            print(f"❌ {script_name} failed with exit code {result.returncode}")
+            print(f"❌ {script_name} failed with exit code {returncode}")
             return False
         
     except Exception as e:
@@ -48,17 +53,19 @@ def main():
     
     print(f"Working directory: {root_dir}")
     
+    # Each script's main() runs in-process with explicit arguments, not this wrapper's argv.
+    # Badges include the per-user USERNAME_badges.md collections that badges/README.md points to.
     scripts = [
-        "generate_main_scoreboard.py",
-        "generate_package_scoreboard.py",
-        "generate_contributor_badges.py"
+        ("generate_main_scoreboard.py", partial(generate_main_scoreboard.main, [])),
+        ("generate_package_scoreboard.py", partial(generate_package_scoreboard.main, [])),
+        ("generate_contributor_badges.py", partial(generate_contributor_badges.main, ['--with-readme']))
     ]
     
     success_count = 0
     total_scripts = len(scripts)
     
-    for script in scripts:
-        if run_script(script, root_dir):
+    for script, script_main in scripts:
+        if run_script(script, script_main, root_dir):
             success_count += 1
     
     print(f"\n{'='*60}")